@@ -1,3 +1,11 @@
 from .protocol import WebSocketProtocol
+from .buffered_protocol import BufferedWebSocketProtocol
+from .broadcast import Hub
+from .deflate import DeflateOptions
+from .budget import ReadBudget
+from .metrics import Metrics
+from .profiler import Profiler
 from .client_protocol import Connect
-from .framing import EncodeFrame
+from .pool import ConnectionPool, ReconnectingClient
+from .supervisor import serve
+from .framing import EncodeFrame, EncodeHeader
@@ -0,0 +1,157 @@
+import asyncio
+
+from .constants import Flags, OPCODES, STATUS_CODES
+from .framing import EncodeFrame
+
+
+SLOW_CONSUMER_POLICIES = ('skip', 'conflate', 'disconnect')
+
+
+class Hub:
+    """
+    Groups of server connections which messages can be broadcast
+    to, each message is encoded once and the same immutable frame
+    is written to every connection in the group.
+
+    Connections whose transport buffer is over high_water are
+    slow consumers and are handled according to slow_consumer:
+     - skip: the message isn't written to them
+     - conflate: only the latest message is kept and written
+       once their buffer drops below high_water
+     - disconnect: the connection is closed with 1008
+    """
+
+    def __init__(self, slow_consumer='skip', high_water=1024 * 1024,
+                 flush_interval=0.05):
+        if slow_consumer not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(
+                'slow_consumer must be one of {}'.format(
+                    ', '.join(SLOW_CONSUMER_POLICIES)))
+
+        self.groups = {}
+        self.slow_consumer = slow_consumer
+        self.high_water = high_water
+        self.flush_interval = flush_interval
+
+        # Latest frame per (group, connection) for conflation
+        self.conflated = {}
+        self.flush_handle = None
+
+    def join(self, group, protocol):
+        """
+        Add a connection to a group, creating the group if needed
+        """
+        self.groups.setdefault(group, set()).add(protocol)
+
+    def leave(self, group, protocol):
+        """
+        Remove a connection from a group, empty groups are dropped
+        """
+        members = self.groups.get(group)
+
+        if members is not None:
+            members.discard(protocol)
+            self.conflated.pop((group, protocol), None)
+
+            if not members:
+                del self.groups[group]
+
+    def leave_all(self, protocol):
+        """
+        Remove a connection from every group, call this from
+        connection_lost.
+        """
+        for group in list(self.groups):
+            self.leave(group, protocol)
+
+    def broadcast(self, group, data, opcode=OPCODES['text']):
+        """
+        Send data to every connection in group, returns
+        the number of connections it was written to.
+        """
+        members = self.groups.get(group)
+
+        if not members:
+            return 0
+
+        frame = bytes(EncodeFrame(data, 1, opcode))
+        high_water = self.high_water
+        conflated = self.conflated
+        closed, slow = [], []
+        sent = 0
+
+        for protocol in members:
+            transport = protocol.context
+
+            if transport.is_closing():
+                closed.append(protocol)
+                continue
+
+            if transport.get_write_buffer_size() > high_water:
+                slow.append(protocol)
+                continue
+
+            # This message supersedes any conflated one
+            if conflated:
+                conflated.pop((group, protocol), None)
+
+            if protocol.flags & Flags.MASK_DATA:
+                protocol.send(data, opcode)
+
+            else:
+                protocol.write(frame)
+
+            sent += 1
+
+        for protocol in closed:
+            self.leave(group, protocol)
+
+        if slow:
+            self.handle_slow_consumers(group, slow, frame, data, opcode)
+
+        return sent
+
+    def handle_slow_consumers(self, group, protocols, frame, data, opcode):
+        if self.slow_consumer == 'conflate':
+            for protocol in protocols:
+                if protocol.flags & Flags.MASK_DATA:
+                    self.conflated[group, protocol] = bytes(
+                        EncodeFrame(data, 1, opcode, mask=True))
+
+                else:
+                    self.conflated[group, protocol] = frame
+
+            self.schedule_flush()
+
+        elif self.slow_consumer == 'disconnect':
+            for protocol in protocols:
+                self.leave_all(protocol)
+                protocol.close_websocket(
+                    STATUS_CODES['policy-violation'], 'Slow Consumer')
+
+    def schedule_flush(self):
+        if self.flush_handle is None:
+            self.flush_handle = asyncio.get_event_loop().call_later(
+                self.flush_interval, self.flush_conflated)
+
+    def flush_conflated(self):
+        """
+        Write the latest conflated frame to every slow consumer
+        which has caught up, check again later for the rest.
+        """
+        self.flush_handle = None
+
+        for key, frame in list(self.conflated.items()):
+            group, protocol = key
+            transport = protocol.context
+
+            if transport.is_closing():
+                del self.conflated[key]
+                self.leave(group, protocol)
+
+            elif transport.get_write_buffer_size() <= self.high_water:
+                del self.conflated[key]
+                protocol.write(frame)
+
+        if self.conflated:
+            self.schedule_flush()
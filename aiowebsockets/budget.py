@@ -0,0 +1,89 @@
+import asyncio
+
+
+class ReadBudget:
+    """
+    Assign to Protocol.read_budget to limit how much of the loop
+    a single connection gets, so one peer pipelining lots of
+    frames can't hold up every other connection.
+
+    Each pass over the received frames handles at most frames
+    frames and bytes bytes, with rate set every connection also
+    gets a token bucket of burst bytes refilled at rate bytes a
+    second. Once either runs out, reading from the connection is
+    paused and the rest of its frames are handled on a later loop
+    iteration, or once the bucket has refilled.
+    """
+
+    def __init__(self, frames=None, bytes=None, rate=None, burst=None):
+        for name, value in (('frames', frames), ('bytes', bytes),
+                            ('rate', rate), ('burst', burst)):
+            if value is not None and value <= 0:
+                raise ValueError('{} must be positive'.format(name))
+
+        self.frames = frames
+        self.bytes = bytes
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+
+    def frames_received(self, protocol, frames):
+        """
+        Wraps the frames iterated by Protocol.process_frames,
+        stopping once the budget is spent and deferring the rest
+        with Protocol.defer_frames.
+        """
+        decoder = protocol.frame_decoder
+        frames_left = self.frames
+        bytes_left = self.bytes
+        rate = self.rate
+        tokens = None
+        mark = decoder.offset
+        exhausted = False
+
+        if rate is not None:
+            now = asyncio.get_event_loop().time()
+            tokens = protocol.budget_tokens
+
+            if tokens is None:
+                tokens = self.burst
+
+            else:
+                tokens = min(
+                    self.burst, tokens + (now - protocol.budget_stamp) * rate)
+
+            protocol.budget_stamp = now
+            exhausted = tokens <= 0
+
+        if not exhausted:
+            for frame in frames:
+                yield frame
+
+                consumed = decoder.offset - mark
+                mark = decoder.offset
+
+                if frames_left is not None:
+                    frames_left -= 1
+                    exhausted = frames_left <= 0
+
+                if bytes_left is not None:
+                    bytes_left -= consumed
+                    exhausted = exhausted or bytes_left <= 0
+
+                # Every frame is paid for as it's handled
+                if tokens is not None:
+                    tokens -= consumed
+                    exhausted = exhausted or tokens <= 0
+
+                if exhausted:
+                    break
+
+        delay = 0.0
+
+        if tokens is not None:
+            protocol.budget_tokens = tokens
+
+            if tokens <= 0:
+                delay = max(-tokens, 1) / rate
+
+        if delay or (exhausted and decoder.offset < decoder.end):
+            protocol.defer_frames(delay)
@@ -0,0 +1,176 @@
+import asyncio
+import weakref
+
+from .protocol import Protocol, WebSocketProtocol
+from .constants import Flags
+
+
+# Read buffer shared by the connections of each event loop
+shared_buffers = weakref.WeakKeyDictionary()
+
+
+def get_shared_buffer(size):
+    """
+    The loop's shared read buffer and a view of it, at least
+    size bytes long. The event loop fills it and we parse it
+    before any other connection reads, so one is enough.
+    """
+    loop = asyncio.get_event_loop()
+    shared = shared_buffers.get(loop)
+
+    if shared is None or len(shared[0]) < size:
+        buffer = bytearray(size)
+        shared = shared_buffers[loop] = (buffer, memoryview(buffer))
+
+    return shared
+
+
+class BufferedProtocol(asyncio.BufferedProtocol, Protocol):
+    """
+    Protocol which lets the event loop read straight into the
+    buffer our FrameDecoder parses, rather than allocating a
+    bytes object per read and copying it into recv_buffer.
+
+    The receive buffer is preallocated and only replaced by a
+    larger one when a frame doesn't fit, it's never resized
+    while the event loop may still hold a view of it. Once a
+    larger buffer has been emptied it's swapped back for one
+    of buffer_size.
+
+    With share_read_buffer set, connections which have nothing
+    buffered read into a buffer shared by the whole loop and
+    only keep a buffer of their own while part of a frame is
+    left over, so idle connections don't hold one at all.
+    """
+    __slots__ = ('recv_view', 'handshake_buffer')
+
+    # Initial size of the receive buffer
+    buffer_size = 64 * 1024
+
+    # Smallest amount of free space handed to the event loop
+    min_read_size = 4096
+
+    # Size of the buffer the handshake is read into
+    handshake_read_size = 4096
+
+    # Read into the loop's shared buffer while nothing is buffered
+    share_read_buffer = False
+
+    def create_buffers(self):
+        super().create_buffers()
+        self.recv_view = None
+        self.handshake_buffer = bytearray(self.handshake_read_size)
+
+    def get_buffer(self, sizehint):
+        """
+        Hand the free space at the end of our receive buffer
+        to the event loop, making room for it first if needed.
+        """
+        if not self.flags & Flags.HANDSHAKE_COMPLETE:
+            return self.handshake_buffer
+
+        decoder = self.frame_decoder
+
+        if decoder.offset == decoder.end:
+            # Nothing buffered, we're free to switch buffers
+            decoder.rewind()
+
+            if self.share_read_buffer:
+                self.use_buffer(*get_shared_buffer(self.buffer_size))
+
+            elif len(self.recv_buffer) != self.buffer_size:
+                self.use_buffer(bytearray(self.buffer_size))
+
+        elif len(self.recv_buffer) - decoder.end < self.min_read_size:
+            self.reserve()
+
+        return self.recv_view[decoder.end:]
+
+    def buffer_updated(self, nbytes):
+        """
+        The event loop wrote nbytes to the buffer returned by
+        get_buffer, feed them to the decoder.
+        """
+        if self.flags & Flags.HANDSHAKE_COMPLETE:
+            if self.keepalive is not None:
+                self.last_read = self.keepalive.now
+
+            self.frame_decoder.feed(nbytes)
+            self.process_frames()
+
+            if self.write_batch is not None:
+                self.flush_writes()
+
+            # The next read on the loop reuses the shared buffer
+            if self.share_read_buffer:
+                self.keep_unconsumed()
+
+        else:
+            self.data_received(self.handshake_buffer[:nbytes])
+
+            if self.flags & Flags.HANDSHAKE_COMPLETE:
+                self.handshake_buffer = None
+
+                # Frames sent along with the handshake were left in
+                # recv_buffer, which get_buffer reads through recv_view
+                self.use_buffer(self.recv_buffer)
+
+    def use_buffer(self, buffer, view=None):
+        self.recv_buffer = self.frame_decoder.buffer = buffer
+        self.recv_view = view if view is not None else memoryview(buffer)
+
+    def reserve(self):
+        """
+        Move the unconsumed data to the front of the receive
+        buffer, and swap it for a larger buffer if that still
+        doesn't leave min_read_size bytes free.
+        """
+        decoder = self.frame_decoder
+        decoder.rewind()
+
+        if len(self.recv_buffer) - decoder.end >= self.min_read_size:
+            return
+
+        self.copy_unconsumed(max(self.buffer_size, len(self.recv_buffer) * 2))
+
+    def keep_unconsumed(self):
+        """
+        Copy what's left of a frame out of the shared buffer
+        into a buffer of our own.
+        """
+        decoder = self.frame_decoder
+        shared, view = get_shared_buffer(self.buffer_size)
+
+        if decoder.offset < decoder.end and self.recv_buffer is shared:
+            decoder.rewind()
+            self.copy_unconsumed(
+                max(self.buffer_size, decoder.end + self.min_read_size))
+
+    def compact_buffer(self):
+        """
+        The receive buffer may be exported to the event loop,
+        so the unconsumed data is moved without resizing it.
+        """
+        self.frame_decoder.rewind()
+
+    def copy_unconsumed(self, size):
+        decoder = self.frame_decoder
+        buffer = bytearray(size)
+        buffer[:decoder.end] = self.recv_view[:decoder.end]
+        self.use_buffer(buffer)
+
+    def clear_buffers(self):
+        """
+        The event loop may be holding a view of recv_buffer,
+        so we only forget its contents instead of clearing it.
+        """
+        self.frame_decoder.reset()
+        self.end_fragments()
+
+
+class BufferedWebSocketProtocol(BufferedProtocol, WebSocketProtocol):
+    """
+    WebSocketProtocol reading through BufferedProtocol, used
+    exactly like WebSocketProtocol.
+    """
+    __slots__ = ()
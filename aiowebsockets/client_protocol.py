@@ -1,17 +1,45 @@
 import asyncio
 import base64
+import collections
 import urllib.parse
-import random
 import ssl
-import struct
 
 from .protocol import Protocol
 from .constants import Flags
+from .exception import BufferExceeded
+from .framing import random_bytes
+from .handshake import accept_key, header_value
+
+
+# Shared by every wss connection not given its own SSLContext
+default_ssl_context = None
+
+
+def shared_ssl_context():
+    """
+    The default client SSLContext, created once so every
+    connection reuses its configuration. Like the context
+    Connect used to build per connection, it doesn't verify
+    the server's certificate, pass your own to verify it.
+    """
+    global default_ssl_context
+
+    if default_ssl_context is None:
+        default_ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        default_ssl_context.check_hostname = False
+        default_ssl_context.verify_mode = ssl.CERT_NONE
+
+    return default_ssl_context
 
 
 class ClientProtocol(Protocol):
 
-    def __init__(self, uri=None, *args, **kargs):
+    # Reading is paused once this many received messages are
+    # waiting for recv(), the rest of the frames read so far are
+    # handled and reading resumed when half of them are read
+    max_queued_messages = 1024
+
+    def __init__(self, uri=None, deflate_options=None, *args, **kargs):
         """
         We need to setup a couple of async
         instances to wait for connection events
@@ -20,8 +48,11 @@ class ClientProtocol(Protocol):
         """
         super().__init__(*args, **kargs)
         self.uri = uri
+        self.deflate_options = deflate_options
         self.connection_event = asyncio.Event()
-        self.recv_queue = asyncio.Queue()
+        self.closed_event = asyncio.Event()
+        self.messages = collections.deque()
+        self.recv_waiter = None
 
     def connection_made(self, context):
         """
@@ -39,77 +70,241 @@ class ClientProtocol(Protocol):
         websocket server that we're indeed a WebSocket
         client.
         """
-        self.ws_key = base64.b64encode(
-            bytes(random.getrandbits(8) for i in range(16)))
+        self.ws_key = base64.b64encode(random_bytes(16))
 
-        headers = ''.join([
+        headers = [
             'GET {} HTTP/1.1\r\n'.format(self.uri.path or '/'),
             'Host: {}\r\n'.format(self.uri.netloc, self.uri.port),
             'Upgrade: websocket\r\n',
             'Connection: Upgrade\r\n',
             'Sec-WebSocket-Key: {}\r\n'.format(self.ws_key.decode('utf-8')),
-            'Sec-WebSocket-Version: 13\r\n\r\n'
-        ]).encode('utf-8')
+        ]
+
+        if self.deflate_options is not None:
+            headers.append('Sec-WebSocket-Extensions: {}\r\n'.format(
+                self.deflate_options.offer()))
+
+        headers.append('Sec-WebSocket-Version: 13\r\n\r\n')
+        headers = ''.join(headers).encode('utf-8')
 
         self.context.write(headers)
 
     def shake_hands(self):
         """
         Handshake response from WebSocket server,
-        validate and upgrade. There is one small
-        bug here, if the client sends data
-        immediately after the handshake and we
-        receive it in one iteration, receive_data
-        won't be called on that frame until the
-        next iteration.
+        validate and upgrade. Frames the server sent
+        straight after it are processed by
+        Protocol.data_received.
         """
-        handshake_fin = self.recv_buffer.find(b'\r\n\r\n')
+        try:
+            handshake_fin = self.find_header_end()
+
+        except BufferExceeded:
+            self.context.close()
+            self.recv_buffer.clear()
+            self.connection_event.set()
+            return
 
         if handshake_fin:
-            if self.recv_buffer[:12] == b'HTTP/1.1 101':
-                self.flags |= Flags.HANDSHAKE_COMPLETE
+            response = self.recv_buffer[:handshake_fin]
+
+            if (response.startswith(b'HTTP/1.1 101') and
+                    header_value(response, 'Sec-WebSocket-Accept') ==
+                    accept_key(self.ws_key)):
+                self.accept_extensions(response)
+
+            del self.recv_buffer[:handshake_fin]
+
+            if not self.flags & Flags.HANDSHAKE_COMPLETE:
+                self.context.close()
+                self.recv_buffer.clear()
+
+            if self.metrics is not None:
+                self.metrics.handshake(
+                    bool(self.flags & Flags.HANDSHAKE_COMPLETE))
 
-            del self.recv_buffer[:handshake_fin + 4]
             self.connection_event.set()
 
-    async def on_message(self, message, type):
+    def accept_extensions(self, response):
+        """
+        Complete the handshake unless the server accepted
+        extensions we didn't offer.
+        """
+        extensions = header_value(response, 'Sec-WebSocket-Extensions')
+
+        if extensions is not None:
+            if self.deflate_options is None:
+                return
+
+            try:
+                self.deflate = self.deflate_options.accept(extensions)
+
+            except ValueError:
+                return
+
+        self.flags |= Flags.HANDSHAKE_COMPLETE
+
+    def on_message(self, message, type):
+        """
+        A Websocket message was received, queue it for
+        recv() and wake it up if it's waiting.
+        """
+        self.messages.append(message)
+
+        if self.recv_waiter is not None:
+            if not self.recv_waiter.done():
+                self.recv_waiter.set_result(None)
+
+            self.recv_waiter = None
+
+        if len(self.messages) >= self.max_queued_messages:
+            self.hold_frames()
+
+    def hold_frames(self):
+        """
+        Stop reading, leaving the frames after this
+        one in the receive buffer.
         """
-        A Websocket message was received, forward it
-        to our queue, which then forwards it to
-        our coroutine.
+        self.flags |= Flags.HOLD_FRAMES
+        self.pause_reading(Flags.RECEIVE_PAUSED)
+
+    def release_frames(self):
         """
-        await self.recv_queue.put(message)
+        Handle the frames held back by hold_frames(), resuming
+        reading unless they've been held back again.
+        """
+        if not self.flags & Flags.RECEIVE_PAUSED:
+            return
+
+        self.flags &= ~Flags.HOLD_FRAMES
+
+        if not self.context.is_closing():
+            self.handle_held_frames()
+
+        if not self.flags & Flags.HOLD_FRAMES:
+            self.resume_reading(Flags.RECEIVE_PAUSED)
 
     def connection_lost(self, exc):
         """
         The connection to our websocket has been lost,
         forward this to our data queue AND event
         """
+        super().connection_lost(exc)
         self.connection_event.set()
-        print('fuck off')
-        self.recv_queue.put_nowait(None)
+        self.closed_event.set()
+
+        if self.recv_waiter is not None:
+            if not self.recv_waiter.done():
+                self.recv_waiter.set_result(None)
+
+            self.recv_waiter = None
+
+    async def close(self, status=1000, reason='', timeout=10.0):
+        """
+        Send a close frame and wait up to timeout seconds for
+        the connection to be closed, aborting it after that.
+        """
+        if self.context is None:
+            return
+
+        if not self.context.is_closing():
+            if self.flags & Flags.HANDSHAKE_COMPLETE:
+                self.close_websocket(status, reason)
+
+            else:
+                self.context.close()
+
+        try:
+            await asyncio.wait_for(self.closed_event.wait(), timeout)
+
+        except asyncio.TimeoutError:
+            self.context.abort()
+
+    async def wait_messages(self):
+        """
+        Wait until a message is queued or the connection is
+        closed, returns whether there are messages.
+        """
+        while not self.messages:
+            if self.closed_event.is_set():
+                return False
+
+            if self.recv_waiter is None:
+                self.recv_waiter = asyncio.get_event_loop().create_future()
+
+            await self.recv_waiter
+
+        return True
+
+    def messages_taken(self):
+        if len(self.messages) <= self.max_queued_messages // 2:
+            self.release_frames()
+
+    async def recv(self):
+        """
+        The next message, None once the connection
+        is closed and every message has been read.
+        """
+        if not await self.wait_messages():
+            return None
+
+        message = self.messages.popleft()
+        self.messages_taken()
+        return message
+
+    async def recv_many(self, max_messages=None):
+        """
+        Every queued message, or at most max_messages of them,
+        waiting for at least one. Returns an empty list once the
+        connection is closed and every message has been read.
+        """
+        if not await self.wait_messages():
+            return []
+
+        messages = self.messages
+
+        if max_messages is None or len(messages) <= max_messages:
+            batch = list(messages)
+            messages.clear()
+
+        else:
+            batch = [messages.popleft() for i in range(max_messages)]
+
+        self.messages_taken()
+        return batch
 
     def __aiter__(self):
         return self
 
     async def __anext__(self):
-        """
-        This is our actual iterator,
-        self.recv_queue contains None when the
-        client is disconnected.
-        """
-        queue_item = await self.recv_queue.get()
+        message = await self.recv()
 
-        if not queue_item:
+        if message is None:
             raise StopAsyncIteration
 
-        return queue_item
+        return message
 
 
 class Connect:
+    """
+    Open a websocket to uri, as an async context manager
+    returning the connected ClientProtocol and closing it on
+    exit, or by awaiting connect().
 
-    def __init__(self, uri):
+    wss connections use ssl, or the shared_ssl_context() when
+    None. Connecting fails with asyncio.TimeoutError when the
+    handshake takes longer than open_timeout seconds.
+    """
+
+    def __init__(self, uri, deflate_options=None, ssl=None,
+                 protocol=ClientProtocol, open_timeout=10.0,
+                 close_timeout=10.0):
         self.uri = urllib.parse.urlparse(uri, allow_fragments=False)
+        self.deflate_options = deflate_options
+        self.protocol = protocol
+        self.open_timeout = open_timeout
+        self.close_timeout = close_timeout
+        self.context = None
 
         if self.uri.scheme not in ('ws', 'wss'):
             raise ValueError('Unsupported protocol [ws/wss]://domain')
@@ -120,29 +315,49 @@ class Connect:
         if not self.uri.port:
             raise ValueError('No port provided in WS uri')
 
-        self.connect_websocket()
+        if self.uri.scheme.lower() != 'wss':
+            self.ssl = None
+
+        elif ssl is None:
+            self.ssl = shared_ssl_context()
 
-    def connect_websocket(self):
-        def factory():
-            return ClientProtocol(uri=self.uri)
+        else:
+            self.ssl = ssl
 
-        addr = self.uri.netloc[:self.uri.netloc.find(':')]
+    def protocol_factory(self):
+        return self.protocol(
+            uri=self.uri, deflate_options=self.deflate_options)
 
-        self.create_connection = asyncio.get_event_loop().create_connection(
-            factory,
-            addr,
+    async def connect(self):
+        """
+        Open a new connection, returning its ClientProtocol
+        once the handshake is complete.
+        """
+        transport, context = await asyncio.get_event_loop().create_connection(
+            self.protocol_factory,
+            self.uri.hostname,
             self.uri.port,
-            ssl=(ssl.SSLContext() if self.uri.scheme.lower() == 'wss' else None)
+            ssl=self.ssl
         )
 
-    async def __aenter__(self):
-        transport, context = await self.create_connection
-        await context.connection_event.wait()
+        try:
+            await asyncio.wait_for(
+                context.connection_event.wait(), self.open_timeout)
+
+        except BaseException:
+            transport.abort()
+            raise
 
         if not context.flags & Flags.HANDSHAKE_COMPLETE:
+            transport.close()
             raise ConnectionRefusedError()
 
         return context
 
+    async def __aenter__(self):
+        self.context = await self.connect()
+        return self.context
+
     async def __aexit__(self, exc_type, exc, tb):
-        pass
+        context, self.context = self.context, None
+        await context.close(timeout=self.close_timeout)
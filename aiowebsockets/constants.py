@@ -3,10 +3,28 @@ class Flags:
     HANDSHAKE_COMPLETE = 0b00000001
     FRAGMENTATION_STARTED = 0b00000010
     MASK_DATA = 0b00000100
+    WRITE_PAUSED = 0b00001000
+    DROP_WRITES = 0b00010000
+    DISPATCH_PAUSED = 0b00100000
+    SENDING_STREAM = 0b01000000
+    RECEIVE_PAUSED = 0b10000000
+    BUDGET_PAUSED = 0b100000000
 
+    # Reading is paused while any of these are set
+    READING_PAUSED = DISPATCH_PAUSED | RECEIVE_PAUSED | BUDGET_PAUSED
 
-# 1MB Max Buffer Size
-MAX_BUFFER_LENGTH = 2 << 31  # 1024 * 1024
+    # Frames received are left in the buffer while set
+    HOLD_FRAMES = 0b1000000000
+
+
+# Default receive limits in bytes, see Protocol.max_frame_size,
+# max_message_size and max_buffer_size
+MAX_FRAME_LENGTH = 16 * 1024 * 1024
+MAX_MESSAGE_LENGTH = 16 * 1024 * 1024
+MAX_BUFFER_LENGTH = 32 * 1024 * 1024
+
+# Set on the first frame of a permessage-deflate compressed message
+RSV1 = 0x40
 
 STATUS_CODES = {
     'close': 1000,
@@ -30,6 +48,9 @@ STATUS_CODES = {
 
 VALID_STATUS_CODES = STATUS_CODES.values()
 
+# What happens to connections whose transport stays paused
+WRITE_LIMIT_POLICIES = ('wait', 'drop', 'close')
+
 OPCODES = {
     "stream": 0x00,
     "text": 0x01,
@@ -0,0 +1,390 @@
+import asyncio
+import collections
+import functools
+import zlib
+
+from .constants import MAX_MESSAGE_LENGTH, RSV1
+from .exception import BufferExceeded
+
+
+EXTENSION_NAME = 'permessage-deflate'
+
+# Removed from the end of every compressed message, RFC 7692 7.2.1
+DEFLATE_TAIL = b'\x00\x00\xff\xff'
+
+FLAG_PARAMS = ('server_no_context_takeover', 'client_no_context_takeover')
+WINDOW_PARAMS = ('server_max_window_bits', 'client_max_window_bits')
+
+
+def parse_extensions(header):
+    """
+    Split a Sec-WebSocket-Extensions header into a list of
+    (name, [(param, value), ...]), value is None for flags.
+    """
+    if isinstance(header, (bytes, bytearray)):
+        header = header.decode('latin-1')
+
+    extensions = []
+
+    for extension in header.split(','):
+        name, *params = [item.strip() for item in extension.split(';')]
+
+        if not name:
+            continue
+
+        parsed = []
+        for param in params:
+            key, equals, value = param.partition('=')
+            value = value.strip().strip('"') if equals else None
+            parsed.append((key.strip().lower(), value))
+
+        extensions.append((name.lower(), parsed))
+
+    return extensions
+
+
+def window_bits(value, minimum=8):
+    """
+    Validate a max_window_bits value
+    """
+    if value is None or not value.isdigit():
+        raise ValueError('Invalid max_window_bits')
+
+    bits = int(value)
+
+    if not minimum <= bits <= 15:
+        raise ValueError('max_window_bits out of range')
+
+    return bits
+
+
+def deflate_params(params):
+    """
+    Turn permessage-deflate parameters into a dict, raises
+    ValueError for unknown, duplicate or malformed ones.
+    """
+    result = {}
+
+    for key, value in params:
+        if key in result:
+            raise ValueError('Duplicate parameter {}'.format(key))
+
+        if key in FLAG_PARAMS:
+            if value is not None:
+                raise ValueError('{} takes no value'.format(key))
+
+            result[key] = True
+
+        elif key in WINDOW_PARAMS:
+            result[key] = value
+
+        else:
+            raise ValueError('Unknown parameter {}'.format(key))
+
+    return result
+
+
+class DeflateOptions:
+    """
+    permessage-deflate (RFC 7692) settings, assign an instance to
+    Protocol.deflate_options (or pass it to Connect) to negotiate
+    compression.
+
+    Messages shorter than min_size are sent uncompressed, messages
+    of at least executor_threshold bytes are compressed in executor
+    (the loop's default executor when None) instead of the loop.
+    """
+
+    def __init__(self,
+                 server_max_window_bits=15,
+                 client_max_window_bits=15,
+                 server_no_context_takeover=False,
+                 client_no_context_takeover=False,
+                 compression_level=zlib.Z_DEFAULT_COMPRESSION,
+                 min_size=128,
+                 executor_threshold=None,
+                 executor=None):
+        # zlib can't compress with an 8 bit window
+        for bits in (server_max_window_bits, client_max_window_bits):
+            if not 9 <= bits <= 15:
+                raise ValueError('max_window_bits must be between 9 and 15')
+
+        self.server_max_window_bits = server_max_window_bits
+        self.client_max_window_bits = client_max_window_bits
+        self.server_no_context_takeover = server_no_context_takeover
+        self.client_no_context_takeover = client_no_context_takeover
+        self.compression_level = compression_level
+        self.min_size = min_size
+        self.executor_threshold = executor_threshold
+        self.executor = executor
+
+    def negotiate(self, header):
+        """
+        Server side, accept the first permessage-deflate offer in
+        the client's Sec-WebSocket-Extensions header that we can.
+        Returns our response header value and a Deflate, or
+        (None, None) when compression won't be used.
+        """
+        for name, params in parse_extensions(header):
+            if name != EXTENSION_NAME:
+                continue
+
+            try:
+                return self.accept_offer(deflate_params(params))
+
+            except ValueError:
+                continue
+
+        return None, None
+
+    def accept_offer(self, params):
+        response = [EXTENSION_NAME]
+
+        server_bits = self.server_max_window_bits
+        if 'server_max_window_bits' in params:
+            server_bits = min(server_bits, window_bits(
+                params['server_max_window_bits']))
+
+            # zlib can't compress with an 8 bit window
+            if server_bits < 9:
+                raise ValueError('server_max_window_bits too small')
+
+        client_bits = 15
+        if 'client_max_window_bits' in params:
+            offered = params['client_max_window_bits']
+            client_bits = self.client_max_window_bits
+
+            if offered is not None:
+                client_bits = min(client_bits, window_bits(offered))
+
+        server_reset = (self.server_no_context_takeover or
+                        'server_no_context_takeover' in params)
+        client_reset = (self.client_no_context_takeover or
+                        'client_no_context_takeover' in params)
+
+        if server_reset:
+            response.append('server_no_context_takeover')
+
+        if client_reset:
+            response.append('client_no_context_takeover')
+
+        if server_bits < 15 or 'server_max_window_bits' in params:
+            response.append('server_max_window_bits={}'.format(server_bits))
+
+        if client_bits < 15:
+            response.append('client_max_window_bits={}'.format(client_bits))
+
+        deflate = Deflate(self, server_bits, client_bits,
+                          server_reset, client_reset)
+
+        return '; '.join(response).encode('latin-1'), deflate
+
+    def offer(self):
+        """
+        Client side, the Sec-WebSocket-Extensions header value
+        """
+        offer = [EXTENSION_NAME]
+
+        if self.server_no_context_takeover:
+            offer.append('server_no_context_takeover')
+
+        if self.client_no_context_takeover:
+            offer.append('client_no_context_takeover')
+
+        if self.server_max_window_bits < 15:
+            offer.append('server_max_window_bits={}'.format(
+                self.server_max_window_bits))
+
+        if self.client_max_window_bits < 15:
+            offer.append('client_max_window_bits={}'.format(
+                self.client_max_window_bits))
+
+        else:
+            offer.append('client_max_window_bits')
+
+        return '; '.join(offer)
+
+    def accept(self, header):
+        """
+        Client side, validate the server's Sec-WebSocket-Extensions
+        response and return a Deflate, raises ValueError if the
+        server responded with something we didn't offer.
+        """
+        extensions = parse_extensions(header)
+
+        if len(extensions) != 1 or extensions[0][0] != EXTENSION_NAME:
+            raise ValueError('Unexpected extensions {}'.format(header))
+
+        params = deflate_params(extensions[0][1])
+
+        server_bits = 15
+        if 'server_max_window_bits' in params:
+            server_bits = window_bits(params['server_max_window_bits'])
+
+        if server_bits > self.server_max_window_bits:
+            raise ValueError('server_max_window_bits larger than offered')
+
+        client_bits = self.client_max_window_bits
+        if 'client_max_window_bits' in params:
+            client_bits = window_bits(params['client_max_window_bits'])
+
+            # zlib can't compress with an 8 bit window
+            if not 9 <= client_bits <= self.client_max_window_bits:
+                raise ValueError('Unusable client_max_window_bits')
+
+        server_reset = 'server_no_context_takeover' in params
+        client_reset = (self.client_no_context_takeover or
+                        'client_no_context_takeover' in params)
+
+        if self.server_no_context_takeover and not server_reset:
+            raise ValueError('server_no_context_takeover not acknowledged')
+
+        return Deflate(self, client_bits, server_bits,
+                       client_reset, server_reset)
+
+
+class Deflate:
+    """
+    Per connection compression state, compress_bits and
+    compress_reset apply to the messages we send, the
+    decompress ones to the messages we receive.
+    """
+
+    def __init__(self, options, compress_bits, decompress_bits,
+                 compress_reset, decompress_reset):
+        self.options = options
+        self.compress_bits = compress_bits
+        self.decompress_bits = decompress_bits
+        self.compress_reset = compress_reset
+        self.decompress_reset = decompress_reset
+
+        self.compressor = self.new_compressor()
+        self.decompressor = zlib.decompressobj(-decompress_bits)
+
+        # Messages waiting for an executor compression to finish
+        self.queue = collections.deque()
+        self.flushed = None
+
+    def new_compressor(self):
+        return zlib.compressobj(
+            self.options.compression_level, zlib.DEFLATED,
+            -self.compress_bits)
+
+    def compress(self, data):
+        """
+        Compress a whole message
+        """
+        compressor = self.compressor
+
+        if self.compress_reset:
+            compressor = self.new_compressor()
+
+        data = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+        if data.endswith(DEFLATE_TAIL):
+            return memoryview(data)[:-4]
+
+        return data
+
+    def decompress(self, data, final, max_length=MAX_MESSAGE_LENGTH):
+        """
+        Decompress a message, or one fragment of it, final
+        is set for the last fragment. Raises BufferExceeded
+        when it inflates to more than max_length bytes, 0
+        disables the limit.
+        """
+        decompressor = self.decompressor
+        result = bytearray(decompressor.decompress(data, max_length))
+
+        if decompressor.unconsumed_tail:
+            raise BufferExceeded
+
+        if final:
+            result += decompressor.decompress(DEFLATE_TAIL)
+
+            if self.decompress_reset:
+                self.decompressor = zlib.decompressobj(-self.decompress_bits)
+
+        return result
+
+    def send(self, data, opcode, write, fail):
+        """
+        Compress data when it's worth it and pass the frame to
+        write(data, opcode, rsv). Frames are written in order,
+        even when the compression is offloaded to an executor.
+        Should that fail, the messages queued are dropped and
+        fail(exc) is called, the connection can't go on.
+        """
+        if self.queue:
+            self.queue.append((data, opcode))
+
+        elif self.offload(data):
+            self.queue.append((data, opcode))
+            self.flush_queue(write, fail)
+
+        else:
+            self.encode(data, opcode, write)
+
+    def offload(self, data):
+        threshold = self.options.executor_threshold
+        return threshold is not None and len(data) >= threshold
+
+    def encode(self, data, opcode, write):
+        if len(data) < self.options.min_size:
+            write(data, opcode)
+
+        else:
+            write(self.compress(data), opcode, RSV1)
+
+    def flush_queue(self, write, fail):
+        """
+        Write queued messages until one has to be
+        compressed in the executor.
+        """
+        while self.queue:
+            data, opcode = self.queue[0]
+
+            if self.offload(data):
+                future = asyncio.get_event_loop().run_in_executor(
+                    self.options.executor, self.compress, data)
+                future.add_done_callback(
+                    functools.partial(self.compressed, write, fail))
+                return
+
+            self.queue.popleft()
+            self.encode(data, opcode, write)
+
+        if self.flushed is not None:
+            self.flushed.set_result(None)
+            self.flushed = None
+
+    async def wait_flushed(self):
+        """
+        Wait until every queued message has been written
+        """
+        if self.queue:
+            if self.flushed is None:
+                self.flushed = asyncio.get_event_loop().create_future()
+
+            await asyncio.shield(self.flushed)
+
+    def compressed(self, write, fail, future):
+        data, opcode = self.queue.popleft()
+
+        try:
+            data = future.result()
+
+        except BaseException as exc:
+            # The compressor has moved on without the peer, nothing
+            # sent after this could be decompressed
+            self.queue.clear()
+
+            if self.flushed is not None:
+                self.flushed.set_result(None)
+                self.flushed = None
+
+            fail(exc)
+            return
+
+        write(data, opcode, RSV1)
+        self.flush_queue(write, fail)
@@ -1,37 +1,89 @@
+#define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
+#include "mask.h"
+
 static const Py_ssize_t EXPECTED_MASK_LEN = 4;
 
+static int
+check_mask(Py_buffer *mask)
+{
+    if(mask->len != EXPECTED_MASK_LEN) {
+        PyErr_SetString(PyExc_ValueError, "mask must be 4 bytes long");
+        return -1;
+    }
+
+    return 0;
+}
+
 static PyObject *
-fast_mask(PyObject *self, PyObject *args)
+fast_mask(PyObject *self, PyObject *args, PyObject *kwargs)
 {
-    PyObject *input, *mask, *result;
-    Py_ssize_t input_len, mask_len, i = 0;
-    char *input_charmap, *result_charmap, *mask_charmap;
-    
-    if(!PyArg_ParseTuple(args, "YY", &input, &mask)) {
+    static char *kwlist[] = {"data", "mask", "offset", NULL};
+    Py_buffer input, mask;
+    Py_ssize_t offset = 0;
+    PyObject *result = NULL;
+
+    if(!PyArg_ParseTupleAndKeywords(args, kwargs, "y*y*|n", kwlist,
+                                    &input, &mask, &offset)) {
         return NULL;
     }
-    
-    // Grab and verify mask length
-    mask_len = PyByteArray_Size(mask);
-    
-    if(mask_len != EXPECTED_MASK_LEN) {
+
+    if(check_mask(&mask) < 0) {
+        goto done;
+    }
+
+    result = PyByteArray_FromStringAndSize(NULL, input.len);
+
+    if(result == NULL) {
+        goto done;
+    }
+
+    websocket_mask(
+        (unsigned char *) PyByteArray_AS_STRING(result),
+        (const unsigned char *) input.buf,
+        input.len,
+        (const unsigned char *) mask.buf,
+        offset
+    );
+
+done:
+    PyBuffer_Release(&input);
+    PyBuffer_Release(&mask);
+    return result;
+}
+
+static PyObject *
+fast_mask_inplace(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"data", "mask", "offset", NULL};
+    Py_buffer data, mask;
+    Py_ssize_t offset = 0;
+    PyObject *result = NULL;
+
+    if(!PyArg_ParseTupleAndKeywords(args, kwargs, "w*y*|n", kwlist,
+                                    &data, &mask, &offset)) {
         return NULL;
     }
-    
-    // Buffers
-    input_len = PyByteArray_Size(input);
-    input_charmap = PyByteArray_AsString(input);
-    mask_charmap = PyByteArray_AsString(mask);
-    result = PyByteArray_FromStringAndSize(NULL, input_len);
-    result_charmap = PyByteArray_AsString(result);
-    
-    // XoR
-    for(; i < input_len; i++) {
-        result_charmap[i] = input_charmap[i] ^ mask_charmap[i & (mask_len - 1)];
+
+    if(check_mask(&mask) < 0) {
+        goto done;
     }
-    
+
+    websocket_mask(
+        (unsigned char *) data.buf,
+        (const unsigned char *) data.buf,
+        data.len,
+        (const unsigned char *) mask.buf,
+        offset
+    );
+
+    // The mask offset to continue from for the next piece
+    result = PyLong_FromSsize_t((offset + data.len) & 3);
+
+done:
+    PyBuffer_Release(&data);
+    PyBuffer_Release(&mask);
     return result;
 }
 
@@ -40,7 +92,17 @@ static PyMethodDef xor_methods[] = {
         "fast_mask",
         (PyCFunction) fast_mask,
         METH_VARARGS | METH_KEYWORDS,
-        "Apply masking to websocket data frames.",
+        "fast_mask(data, mask, offset=0)\n\n"
+        "Apply masking to websocket data frames, returns a new bytearray.\n"
+        "offset is the position of data[0] within the masked payload.",
+    },
+    {
+        "fast_mask_inplace",
+        (PyCFunction) fast_mask_inplace,
+        METH_VARARGS | METH_KEYWORDS,
+        "fast_mask_inplace(data, mask, offset=0)\n\n"
+        "Apply masking to a writable buffer in place, returns the mask\n"
+        "offset the next piece of the payload starts at.",
     },
     {NULL, NULL, 0, NULL},      /* Sentinel */
 };
@@ -62,4 +124,3 @@ PyInit_fast_mask(void)
 {
     return PyModule_Create(&fast_mask_module);
 }
-
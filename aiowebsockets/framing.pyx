@@ -1,100 +1,448 @@
-import struct
-import random
+import os
 
-from .exception import IncompleteFrame, ProtocolError
+from libc.string cimport memcpy, memmove
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+from cpython.bytearray cimport PyByteArray_FromStringAndSize
+from cpython.bytearray cimport PyByteArray_AS_STRING
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
+
+from .exception import IncompleteFrame, ProtocolError, BufferExceeded
 from .constants import OPCODES
 
 
-try:
-    from .fast_mask import fast_mask
+cdef extern from "Python.h":
+    const Py_ssize_t PY_SSIZE_T_MAX
+
+
+cdef extern from "mask.h":
+    void websocket_mask(unsigned char *output,
+                        const unsigned char *input,
+                        Py_ssize_t length,
+                        const unsigned char *mask,
+                        Py_ssize_t offset)
+
+
+cdef extern from "utf8.h":
+    const unsigned int UTF8_ACCEPT
+    const unsigned int UTF8_REJECT
+    unsigned int utf8_validate(unsigned int state,
+                               const unsigned char *data,
+                               Py_ssize_t length)
+
+
+# Mask keys and handshake nonces are handed out from entropy_pool,
+# refilled from os.urandom ENTROPY_POOL_SIZE bytes at a time
+cdef enum:
+    ENTROPY_POOL_SIZE = 4096
+
+cdef bytes entropy_pool = b''
+cdef Py_ssize_t entropy_offset = ENTROPY_POOL_SIZE
+
+
+cdef inline const unsigned char *take_random(Py_ssize_t length) except NULL:
+    """
+    length (at most ENTROPY_POOL_SIZE) unused bytes of the pool
+    """
+    global entropy_pool, entropy_offset
+
+    if entropy_offset + length > ENTROPY_POOL_SIZE:
+        entropy_pool = os.urandom(ENTROPY_POOL_SIZE)
+        entropy_offset = 0
+
+    entropy_offset += length
+
+    return (<const unsigned char *>PyBytes_AS_STRING(entropy_pool) +
+            entropy_offset - length)
+
+
+def random_bytes(Py_ssize_t length):
+    """
+    length cryptographically random bytes from the pool
+    masks are taken from, for handshake nonces.
+    """
+    if length > ENTROPY_POOL_SIZE:
+        return os.urandom(length)
+
+    return PyBytes_FromStringAndSize(
+        <const char *>take_random(length), length)
+
+
+def discard_entropy():
+    """
+    Forget the pool, so that forked processes
+    don't hand out the same bytes.
+    """
+    global entropy_offset
+    entropy_offset = ENTROPY_POOL_SIZE
+
+
+os.register_at_fork(after_in_child=discard_entropy)
+
+
+cdef class Utf8Validator:
+    """
+    Validates utf-8 split over several pieces, such as the
+    fragments of a text message, without decoding it.
+    """
+    cdef unsigned int state
+
+    def __init__(self):
+        self.state = UTF8_ACCEPT
+
+    def validate(self, data, final=False):
+        """
+        Validate the next piece of data, raises UnicodeDecodeError
+        as soon as it's invalid, or when final is set and the data
+        stops in the middle of a character.
+        """
+        cdef Py_buffer view
+
+        PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+
+        try:
+            self.state = utf8_validate(
+                self.state, <const unsigned char *>view.buf, view.len)
+
+        finally:
+            PyBuffer_Release(&view)
+
+        if self.state == UTF8_REJECT or (final and self.state != UTF8_ACCEPT):
+            raise invalid_utf8()
 
-except ImportError:
-    print('Could not import fast_mask.c; defaulting to utils.fast_mask')
-    from .utils import fast_mask
+
+cdef invalid_utf8():
+    return UnicodeDecodeError('utf-8', b'', 0, 0, 'invalid utf-8 data')
+
+
+cpdef validate_utf8(data):
+    """
+    Check that data is valid utf-8 without decoding it,
+    raises UnicodeDecodeError otherwise.
+    """
+    cdef Py_buffer view
+    cdef unsigned int state
+
+    PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+
+    try:
+        state = utf8_validate(
+            UTF8_ACCEPT, <const unsigned char *>view.buf, view.len)
+
+    finally:
+        PyBuffer_Release(&view)
+
+    if state != UTF8_ACCEPT:
+        raise invalid_utf8()
 
 
 cdef class FrameDecoder:
-    cdef readonly int fin, opcode, masked, rsv, payload_len, payload_start
-    cdef bytearray buffer
+    """
+    Iterates over the frames held in buffer without modifying it,
+    offset points at the first byte which hasn't been consumed yet
+    and end just past the last byte fed to the decoder.
+
+    Consumed frames are only dropped from the buffer when compact()
+    is called, which the protocol does once per data_received rather
+    than once per frame.
+
+    With streaming set, data frames whose payload hasn't fully
+    arrived are yielded in pieces, partial is set while more of
+    the frame is to come and chunk_offset is the position of
+    data within the frame's payload.
+
+    With timed set, the time spent unmasking payloads is added
+    up in mask_seconds, for the profiler.
+
+    decode_messages() hands out text messages as str rather
+    than validated bytes when decode_text is set.
+
+    Frames longer than max_payload, or taking the message they
+    belong to over max_message, raise BufferExceeded as soon as
+    their length has been read, before their payload is buffered.
+    max_buffer is only checked by the protocol, 0 disables each.
+    """
+    cdef readonly int fin, opcode, masked, rsv, partial
+    cdef readonly Py_ssize_t payload_len, payload_start
+    cdef readonly Py_ssize_t frame_start, offset, end
+    cdef readonly Py_ssize_t chunk_offset, remaining
+    cdef readonly Py_ssize_t message_length, next_message_length
+    cdef public Py_ssize_t max_payload, max_message, max_buffer
+    cdef public int streaming, timed, decode_text
+    cdef public double mask_seconds
+    cdef public bytearray buffer
     cdef readonly bytearray data
+    cdef unsigned char mask_key[4]
 
     def __init__(self, buffer):
         self.buffer = buffer
-        self.data = bytearray()
+        self.data = None
         self.fin = 0
         self.opcode = 0
         self.masked = 0
         self.rsv = 0
         self.payload_len = 0
         self.payload_start = 0
-
-    cdef process_header(self):
+        self.frame_start = 0
+        self.offset = 0
+        self.end = len(buffer)
+        self.streaming = 0
+        self.timed = 0
+        self.decode_text = 0
+        self.mask_seconds = 0
+        self.partial = 0
+        self.chunk_offset = 0
+        self.remaining = 0
+        self.message_length = 0
+        self.next_message_length = 0
+        self.max_payload = 0
+        self.max_message = 0
+        self.max_buffer = 0
+
+    cdef process_header(self, const unsigned char *frame,
+                        Py_ssize_t available):
         """
         Interpret the websocket headers
         """
         # Make sure we have the first two available bytes before anything else
-        if len(self.buffer) < 2:
+        if available < 2:
             raise StopIteration
 
-        self.fin = self.buffer[0] & 0x80
-        self.opcode = self.buffer[0] & 0x0f
-        self.masked = self.buffer[1] & 0x80
-        self.rsv = self.buffer[0] & 0x70
+        self.fin = frame[0] & 0x80
+        self.opcode = frame[0] & 0x0f
+        self.masked = frame[1] & 0x80
+        self.rsv = frame[0] & 0x70
 
-    cdef process_length(self):
+    cdef process_length(self, const unsigned char *frame,
+                        Py_ssize_t available):
         """
-        Figure out the length of the frame
+        Figure out the length of the frame, the extended
+        lengths are read straight from the buffer in
+        network byte order.
         """
-        self.payload_len = self.buffer[1] & 0x7f
+        cdef unsigned long long length = 0
+        cdef int i
+
+        self.payload_len = frame[1] & 0x7f
         self.payload_start = 2
 
         if self.payload_len == 126:
-            if len(self.buffer) < 4:
+            if available < 4:
                 raise StopIteration
 
             if self.opcode in OPCODES['control']:
                 raise ProtocolError('Control Frames are limited to 125 bytes')
 
-            self.payload_len = struct.unpack('!H', self.buffer[2:4])[0]
+            self.payload_len = (frame[2] << 8) | frame[3]
             self.payload_start = 4
 
         elif self.payload_len == 127:
-            if len(self.buffer) < 10:
+            if available < 10:
                 raise StopIteration
 
             if self.opcode in OPCODES['control']:
                 raise ProtocolError('Control Frames are limited to 125 bytes')
 
-            self.payload_len = struct.unpack('!Q', self.buffer[2:10])[0]
+            for i in range(2, 10):
+                length = (length << 8) | frame[i]
+
+            if length & 0x8000000000000000:
+                raise ProtocolError('Most significant length bit must be 0')
+
+            # Leave room for the header, so frame offsets can't overflow
+            if length > <unsigned long long>(PY_SSIZE_T_MAX - 14):
+                raise BufferExceeded
+
+            self.payload_len = <Py_ssize_t>length
             self.payload_start = 10
 
-    cdef process_payload(self):
+        self.check_limits()
+
+    cdef check_limits(self):
+        """
+        Refuse frames over max_payload and messages growing over
+        max_message, the message length is only updated once
+        the frame is consumed.
+        """
+        if self.max_payload and self.payload_len > self.max_payload:
+            raise BufferExceeded
+
+        # Control frames have the 0x08 bit set
+        if self.opcode & 0x08:
+            return
+
+        self.next_message_length = self.payload_len
+
+        if self.opcode == OPCODES['stream']:
+            self.next_message_length += self.message_length
+
+        if self.max_message and self.next_message_length > self.max_message:
+            raise BufferExceeded
+
+    cdef Py_ssize_t process_payload(self, unsigned char *frame,
+                                    Py_ssize_t available) except -1:
         """
         The payload also inclueds the mask, if
         the data has been masked.
 
         Mask is 4 bytes, afterward the entire
-        payload is sent.
+        payload is sent. The payload is copied out
+        of the buffer once and unmasked in place.
+
+        Returns the number of payload bytes read,
+        less than payload_len for a partial frame.
         """
+        cdef Py_ssize_t start, length = self.payload_len
+
         if self.masked:
             self.payload_start += 4
 
-        if len(self.buffer) < self.payload_start + self.payload_len:
-            raise StopIteration
+        if self.payload_len > available - self.payload_start:
+            if (not self.streaming or available <= self.payload_start or
+                    self.opcode in OPCODES['control']):
+                raise StopIteration
+
+            length = available - self.payload_start
 
-        self.data = self.buffer[
-            self.payload_start:self.payload_start + self.payload_len]
+        start = self.frame_start + self.payload_start
+        self.data = self.buffer[start:start + length]
 
         if self.masked:
-            self.data = fast_mask(
-                self.data,
-                self.buffer[self.payload_start - 4:self.payload_start]
-            )
+            memcpy(self.mask_key, frame + self.payload_start - 4, 4)
+            self.unmask(length, 0)
+
+        self.chunk_offset = 0
+        self.remaining = self.payload_len - length
+        self.partial = self.remaining > 0
+
+        return length
+
+    cdef void unmask(self, Py_ssize_t length, Py_ssize_t offset):
+        cdef timespec start, stop
+
+        if not self.timed:
+            websocket_mask(self.data, self.data, length, self.mask_key, offset)
+            return
+
+        clock_gettime(CLOCK_MONOTONIC, &start)
+        websocket_mask(self.data, self.data, length, self.mask_key, offset)
+        clock_gettime(CLOCK_MONOTONIC, &stop)
+
+        self.mask_seconds += ((stop.tv_sec - start.tv_sec) +
+                              (stop.tv_nsec - start.tv_nsec) * 1e-9)
 
     cdef process_frame(self):
-        self.process_header()
-        self.process_length()
-        self.process_payload()
+        cdef unsigned char *frame = self.buffer
+        cdef Py_ssize_t available = self.end - self.offset
+
+        frame += self.offset
+        self.frame_start = self.offset
+
+        # Released now in case the frame is incomplete
+        self.data = None
+
+        self.process_header(frame, available)
+        self.process_length(frame, available)
+
+        self.offset += self.payload_start + self.process_payload(
+            frame, available)
+
+        if not self.opcode & 0x08:
+            self.message_length = self.next_message_length
+
+    cdef continue_frame(self):
+        """
+        Read the next piece of a partial frame's payload
+        """
+        cdef Py_ssize_t length = min(self.end - self.offset, self.remaining)
+
+        self.data = self.buffer[self.offset:self.offset + length]
+
+        if self.masked:
+            self.unmask(length, self.payload_len - self.remaining)
+
+        self.chunk_offset = self.payload_len - self.remaining
+        self.remaining -= length
+        self.partial = self.remaining > 0
+        self.offset += length
+
+    def feed(self, Py_ssize_t length):
+        """
+        length bytes have been written to the buffer
+        right after the ones we already know about.
+        """
+        self.end += length
+
+    def compact(self):
+        """
+        Drop every frame consumed since the last call
+        from the front of the buffer.
+        """
+        if self.offset:
+            del self.buffer[:self.offset]
+            self.end -= self.offset
+            self.offset = 0
+
+    def rewind(self):
+        """
+        Move the bytes which haven't been consumed yet to the
+        front of the buffer without resizing it, for buffers
+        which are preallocated or exported to the event loop.
+        """
+        cdef unsigned char *buffer = self.buffer
+
+        if self.offset:
+            memmove(buffer, buffer + self.offset, self.end - self.offset)
+            self.end -= self.offset
+            self.offset = 0
+
+    def reset(self):
+        """
+        Forget the read position, used when the
+        buffer has been cleared from under us.
+        """
+        self.offset = 0
+        self.end = 0
+        self.partial = 0
+        self.remaining = 0
+        self.message_length = 0
+
+    def decode_messages(self, list messages):
+        """
+        Decode every complete frame fed so far in one call,
+        appending the payload and opcode of the ones holding a
+        whole, uncompressed text or binary message to messages,
+        text is validated as utf-8 (or decoded, see decode_text).
+
+        Returns True as soon as a frame the protocol has to
+        handle itself is reached (control frames, fragments and
+        compressed frames), the decoder is left on it as if it
+        had just been yielded. Returns False once every complete
+        frame has been consumed. Not for streaming decoders.
+        """
+        while self.offset < self.end:
+            try:
+                self.process_frame()
+
+            except StopIteration:
+                return False
+
+            if (not self.fin or self.rsv or
+                    (self.opcode != 1 and self.opcode != 2)):
+                return True
+
+            if self.opcode == 2:
+                messages.append((self.data, 2))
+
+            elif self.decode_text:
+                messages.append((self.data.decode('utf-8'), 1))
+
+            else:
+                validate_utf8(self.data)
+                messages.append((self.data, 1))
+
+        self.data = None
+        return False
 
     def __len__(self):
         return self.payload_start + self.payload_len
@@ -103,53 +451,142 @@ cdef class FrameDecoder:
         return self
 
     def __next__(self):
-        if not self.buffer:
+        if self.offset >= self.end:
+            # Don't hold on to the last payload while idle
+            self.data = None
             raise StopIteration
 
-        self.process_frame()
+        if self.partial:
+            self.continue_frame()
+
+        else:
+            self.process_frame()
 
         return self
 
 
-cpdef bytearray EncodeFrame(bytearray data,
+cdef inline Py_ssize_t header_length(Py_ssize_t length, int masked):
+    """
+    Length of the header for a payload of length bytes,
+    including the mask key.
+    """
+    cdef Py_ssize_t header_len = 2
+
+    if length > 65535:
+        header_len = 10
+
+    elif length > 125:
+        header_len = 4
+
+    if masked:
+        header_len += 4
+
+    return header_len
+
+
+cdef inline Py_ssize_t write_header(unsigned char *header,
+                                    Py_ssize_t length,
+                                    int fin,
+                                    int opcode,
+                                    int masked,
+                                    int rsv):
+    """
+    Write the frame header for a payload of length bytes and
+    return its length, excluding the mask key.
+    """
+    cdef int i
+
+    # FIN Bit, RSV Bits and Opcode
+    header[0] = (0x80 if fin else 0) | (rsv & 0x70) | opcode
+
+    # Mask bit
+    header[1] = 0x80 if masked else 0
+
+    # Length
+    if length <= 125:
+        header[1] |= length
+        return 2
+
+    elif length <= 65535:
+        header[1] |= 126
+        header[2] = (length >> 8) & 0xff
+        header[3] = length & 0xff
+        return 4
+
+    header[1] |= 127
+    for i in range(8):
+        header[9 - i] = (length >> (i * 8)) & 0xff
+
+    return 10
+
+
+cpdef bytes EncodeHeader(data,
+                         int fin=1,
+                         int opcode=OPCODES['binary'],
+                         int rsv=0):
+    """
+    Encode only the header of an unmasked frame carrying data,
+    so that the header and payload can be written with
+    transport.writelines without copying the payload.
+    """
+    cdef Py_buffer view
+    cdef unsigned char header[10]
+    cdef Py_ssize_t header_len
+
+    PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+
+    try:
+        header_len = write_header(header, view.len, fin, opcode, 0, rsv)
+
+    finally:
+        PyBuffer_Release(&view)
+
+    return PyBytes_FromStringAndSize(<char *>header, header_len)
+
+
+cpdef bytearray EncodeFrame(data,
                             int fin=1,
                             int opcode=OPCODES['binary'],
-                            mask=False):
+                            mask=False,
+                            int rsv=0):
     """
     Encode a websocket packet before sending to
     the browser. Bytes are identical to the Frame
     class above.
-    """
-    cdef bytearray buffer = bytearray(2)
-    cdef int length = 0
 
-    # FIN Bit
-    if fin:
-        buffer[0] |= 0x80
+    data may be any buffer, it's copied (or masked)
+    straight into a buffer sized for the whole frame.
+    """
+    cdef Py_buffer view
+    cdef bytearray buffer
+    cdef unsigned char *frame
+    cdef Py_ssize_t header_len
+    cdef int masked = 1 if mask else 0
 
-    # Opcode
-    buffer[0] |= opcode
+    PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
 
-    # Length
-    length = len(data)
-    if length <= 125:
-        buffer[1] |= length
+    try:
+        buffer = PyByteArray_FromStringAndSize(
+            NULL, header_length(view.len, masked) + view.len)
+        frame = <unsigned char *>PyByteArray_AS_STRING(buffer)
 
-    elif length <= 65535:
-        buffer[1] |= 126
-        buffer.extend(struct.pack('!H', length))
+        header_len = write_header(
+            frame, view.len, fin, opcode, masked, rsv)
 
-    else:
-        buffer[1] |= 127
-        buffer.extend(struct.pack('!Q', length))
+        if masked:
+            memcpy(frame + header_len, take_random(4), 4)
+            header_len += 4
 
-    # Mask bits
-    if mask:
-        buffer[1] |= 0x80
+            websocket_mask(frame + header_len,
+                           <const unsigned char *>view.buf,
+                           view.len,
+                           frame + header_len - 4,
+                           0)
 
-        buffer.extend(struct.pack('!I', random.getrandbits(32)))
-        data = fast_mask(data, buffer[-4:])
+        else:
+            memcpy(frame + header_len, view.buf, view.len)
 
-    buffer.extend(data)
+    finally:
+        PyBuffer_Release(&view)
 
     return buffer
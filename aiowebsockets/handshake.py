@@ -12,50 +12,124 @@ HANDSHAKE_TEMPLATE = (
     b'Sec-WebSocket-Accept: %s',
     b'\r\n'
 )
+EXTENSIONS_TEMPLATE = (
+    b'Sec-WebSocket-Extensions: %s',
+    b'\r\n'
+)
+
+
+def accept_key(key):
+    """
+    The Sec-WebSocket-Accept value answering key
+    """
+    return base64.b64encode(hashlib.sha1(key + HANDSHAKE_MAGIC).digest())
+
+
+def parse_headers(raw_data):
+    """
+    Parse the header into a nice dictionary, in the future
+    we could look at using http.server's BaseRequestHandler
+    to parse it for us instead of using this ghetto method.
+    """
+    headers = {}
+
+    for header in raw_data.split(b'\r\n'):
+        header_args = header.split(b': ', 1)
+
+        if len(header_args) == 2:
+            headers[header_args[0].decode('utf-8')] = header_args[1]
+
+    return headers
+
+
+def header_value(raw_data, name, lowered=None):
+    """
+    Case insensitive lookup of a single header, without
+    parsing every header. lowered is raw_data.lower(),
+    pass it in when looking up several headers.
+    """
+    if lowered is None:
+        lowered = raw_data.lower()
+
+    needle = b'\r\n' + name.lower().encode('latin-1') + b':'
+    start = lowered.find(needle)
+
+    if start == -1:
+        return None
+
+    start += len(needle)
+    end = lowered.find(b'\r\n', start)
+
+    if end == -1:
+        end = len(raw_data)
+
+    return bytes(raw_data[start:end]).strip()
 
 
 class Handshake:
+    # Kept for as long as the connection, so kept small
+    __slots__ = ('raw_data', 'lowered', 'key', 'deflate', 'extensions')
 
-    def __init__(self, raw_data):
+    def __init__(self, raw_data, deflate_options=None):
         """
-        Let's just setup a few variables here
+        Let's just setup a few variables here, deflate_options
+        enables negotiating permessage-deflate.
         """
-        self.headers = {}
+        self.raw_data = bytes(raw_data)
+        self.lowered = self.raw_data.lower()
+        self.deflate = None
+        self.extensions = None
 
-        self.parse_headers(raw_data)
         self.check_header()
 
-    def parse_headers(self, raw_data):
+        if deflate_options is not None:
+            self.negotiate_extensions(deflate_options)
+
+        # Only needed while we look up several headers at once
+        self.lowered = None
+
+    @property
+    def headers(self):
         """
-        Parse the header into a nice dictionary, in the future
-        we could look at using http.server's BaseRequestHandler
-        to parse it for us instead of using this ghetto method.
+        Every header in a dictionary, built each time it's asked for
         """
-        for header in raw_data.split(b'\r\n'):
-            header_args = header.split(b': ', 1)
+        return parse_headers(self.raw_data)
 
-            if len(header_args) == 2:
-                self.headers[
-                    header_args[0].decode('utf-8')] = header_args[1]
+    def get(self, name):
+        """
+        Case insensitive header lookup
+        """
+        return header_value(self.raw_data, name, self.lowered)
 
     def check_header(self):
         """
         Make sure our client is trying to upgrade their connection,
         otherwise we don't really care about them.
         """
-        if 'Sec-WebSocket-Key' not in self.headers:
+        self.key = self.get('Sec-WebSocket-Key')
+
+        if not self.key:
             raise ValueError('Sec-WebSocket-Key not in headers')
 
-        if 'Connection' not in self.headers:
+        if self.get('Connection') is None:
             raise ValueError('Connection not in headers')
 
-        if 'Upgrade' not in self.headers:
+        if self.get('Upgrade') is None:
             raise ValueError('Upgrade not in headers')
 
+    def negotiate_extensions(self, deflate_options):
+        offer = self.get('Sec-WebSocket-Extensions')
+
+        if offer is not None:
+            self.extensions, self.deflate = deflate_options.negotiate(offer)
+
     @property
     def response_header(self):
-        ws_challenge = self.headers['Sec-WebSocket-Key'] + HANDSHAKE_MAGIC
-        ws_challenge = hashlib.sha1(ws_challenge).digest()
-        ws_challenge = base64.b64encode(ws_challenge)
+        ws_challenge = accept_key(self.key)
+
+        if self.extensions:
+            return b'\r\n'.join(
+                HANDSHAKE_TEMPLATE[:-1] + EXTENSIONS_TEMPLATE
+            ) % (ws_challenge, self.extensions)
 
         return b'\r\n'.join(HANDSHAKE_TEMPLATE) % ws_challenge
@@ -0,0 +1,108 @@
+import asyncio
+import math
+import weakref
+
+
+# One wheel per event loop, shared by every connection on it
+wheels = weakref.WeakKeyDictionary()
+
+
+def get_wheel(loop=None):
+    """
+    The default TimerWheel of loop, created on first use
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+
+    wheel = wheels.get(loop)
+
+    if wheel is None:
+        wheel = wheels[loop] = TimerWheel(loop)
+
+    return wheel
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel driving the keepalive of every connection
+    on a loop with a single timer, rather than a call_later per
+    connection.
+
+    Connections sit in the bucket of their next deadline, every
+    resolution seconds the wheel advances one bucket and calls
+    keepalive_check(now) on the connections in it, which returns
+    their next deadline or None once they're done. Deadlines
+    further away than the wheel goes round are checked early and
+    put back, so the work per tick only depends on the number of
+    connections due.
+
+    now is the loop time of the last tick, connections use it to
+    timestamp their activity without calling loop.time().
+    """
+
+    def __init__(self, loop=None, resolution=1.0, slots=512):
+        self.loop = loop or asyncio.get_event_loop()
+        self.resolution = resolution
+        self.buckets = [set() for i in range(slots)]
+        self.cursor = 0
+        self.count = 0
+        self.now = self.loop.time()
+        self.handle = None
+
+    def __len__(self):
+        return self.count
+
+    def add(self, protocol, deadline):
+        """
+        Schedule protocol to be checked at deadline
+        """
+        if self.handle is None:
+            self.now = self.loop.time()
+            self.handle = self.loop.call_later(self.resolution, self.tick)
+
+        ticks = math.ceil((deadline - self.now) / self.resolution)
+        ticks = min(max(ticks, 1), len(self.buckets) - 1)
+
+        slot = (self.cursor + ticks) % len(self.buckets)
+        self.buckets[slot].add(protocol)
+        protocol.keepalive_slot = slot
+        self.count += 1
+
+    def discard(self, protocol):
+        slot = protocol.keepalive_slot
+
+        if slot is not None:
+            protocol.keepalive_slot = None
+            self.buckets[slot].discard(protocol)
+            self.count -= 1
+
+    def tick(self):
+        self.now = self.loop.time()
+        self.cursor = (self.cursor + 1) % len(self.buckets)
+
+        due = self.buckets[self.cursor]
+        self.buckets[self.cursor] = set()
+        self.count -= len(due)
+
+        for protocol in due:
+            protocol.keepalive_slot = None
+
+            try:
+                deadline = protocol.keepalive_check(self.now)
+
+            except Exception as exc:
+                self.loop.call_exception_handler({
+                    'message': 'Exception in keepalive_check',
+                    'exception': exc,
+                    'protocol': protocol,
+                })
+                continue
+
+            if deadline is not None:
+                self.add(protocol, deadline)
+
+        if self.count:
+            self.handle = self.loop.call_later(self.resolution, self.tick)
+
+        else:
+            self.handle = None
@@ -0,0 +1,60 @@
+#ifndef AIOWEBSOCKETS_MASK_H
+#define AIOWEBSOCKETS_MASK_H
+
+#include <stdint.h>
+#include <string.h>
+
+#if defined(__SSE2__)
+#include <emmintrin.h>
+#endif
+
+/*
+ * XoR length bytes of input with the 4 byte websocket mask and write
+ * them to output, output may be the same buffer as input. offset is
+ * the position of input[0] within the payload, so that a payload can
+ * be unmasked in several pieces as it arrives.
+ */
+static inline void
+websocket_mask(unsigned char *output,
+               const unsigned char *input,
+               Py_ssize_t length,
+               const unsigned char *mask,
+               Py_ssize_t offset)
+{
+    unsigned char rotated[8];
+    uint64_t word, chunk;
+    Py_ssize_t i = 0;
+
+    // Rotate the mask so that rotated[0] applies to input[0]
+    for(; i < 8; i++) {
+        rotated[i] = mask[(offset + i) & 3];
+    }
+
+    memcpy(&word, rotated, sizeof(word));
+    i = 0;
+
+#if defined(__SSE2__)
+    {
+        __m128i vector_mask = _mm_set1_epi64x((long long) word);
+        __m128i vector;
+
+        for(; i + 16 <= length; i += 16) {
+            vector = _mm_loadu_si128((const __m128i *) (input + i));
+            vector = _mm_xor_si128(vector, vector_mask);
+            _mm_storeu_si128((__m128i *) (output + i), vector);
+        }
+    }
+#endif
+
+    for(; i + 8 <= length; i += 8) {
+        memcpy(&chunk, input + i, sizeof(chunk));
+        chunk ^= word;
+        memcpy(output + i, &chunk, sizeof(chunk));
+    }
+
+    for(; i < length; i++) {
+        output[i] = input[i] ^ rotated[i & 7];
+    }
+}
+
+#endif
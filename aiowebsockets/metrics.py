@@ -0,0 +1,292 @@
+import bisect
+import collections
+import time
+import weakref
+
+from .constants import OPCODES
+
+
+OPCODE_NAMES = {
+    OPCODES['stream']: 'continuation',
+    OPCODES['text']: 'text',
+    OPCODES['binary']: 'binary',
+    OPCODES['close']: 'close',
+    OPCODES['ping']: 'ping',
+    OPCODES['pong']: 'pong',
+}
+
+# on_message durations in seconds
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+
+class Histogram:
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self):
+        """
+        Cumulative counts per upper bound, the last bound is inf
+        """
+        cumulative, total = [], 0
+
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            cumulative.append((bound, total))
+
+        return {'buckets': cumulative, 'sum': self.sum, 'count': self.count}
+
+
+class ConnectionMetrics:
+    __slots__ = ('frames_in', 'frames_out', 'bytes_in', 'bytes_out',
+                 'messages')
+
+    def __init__(self):
+        self.frames_in = 0
+        self.frames_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.messages = 0
+
+    def snapshot(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Metrics:
+    """
+    Counters shared by every connection of the protocols it's
+    assigned to (Protocol.metrics), so they're aggregated as
+    they're counted. With per_connection set, every connection
+    also gets its own frame, byte and message counters.
+
+    snapshot() returns everything as a dict, render_prometheus()
+    in the Prometheus text format.
+    """
+
+    def __init__(self, per_connection=False, buckets=DEFAULT_BUCKETS):
+        self.frames_in = collections.Counter()
+        self.frames_out = collections.Counter()
+        self.bytes_in = collections.Counter()
+        self.bytes_out = collections.Counter()
+        self.messages = collections.Counter()
+        self.handshakes = collections.Counter()
+        self.close_codes = collections.Counter()
+        self.fragmented_messages = 0
+        self.write_pauses = 0
+        self.connections = 0
+        self.connections_total = 0
+
+        # Largest sizes seen, in bytes
+        self.recv_buffer_high_water = 0
+        self.write_buffer_high_water = 0
+        self.message_high_water = 0
+
+        self.on_message = Histogram(buckets)
+        self.per_connection = None
+
+        if per_connection:
+            self.per_connection = weakref.WeakKeyDictionary()
+
+    def connection_made(self, protocol):
+        self.connections += 1
+        self.connections_total += 1
+
+        if self.per_connection is not None:
+            self.per_connection[protocol] = ConnectionMetrics()
+
+    def connection_lost(self, protocol):
+        self.connections -= 1
+
+    def connection(self, protocol):
+        """
+        The counters of a single connection, per_connection only
+        """
+        return self.per_connection[protocol].snapshot()
+
+    def handshake(self, success):
+        self.handshakes['success' if success else 'failure'] += 1
+
+    def closed(self, status):
+        self.close_codes[status] += 1
+
+    def frames_received(self, protocol, decoder):
+        """
+        Wraps the decoder iterated by Protocol.process_frames,
+        counting every frame and its payload bytes.
+        """
+        buffered = decoder.end - decoder.offset
+
+        if buffered > self.recv_buffer_high_water:
+            self.recv_buffer_high_water = buffered
+
+        frames_in, bytes_in = self.frames_in, self.bytes_in
+        count = length = 0
+
+        try:
+            for frame in decoder:
+                frames_in[frame.opcode] += 1
+                bytes_in[frame.opcode] += len(frame.data)
+                count += 1
+                length += len(frame.data)
+                yield frame
+
+        finally:
+            if self.per_connection is not None:
+                connection = self.per_connection.get(protocol)
+
+                if connection is not None:
+                    connection.frames_in += count
+                    connection.bytes_in += length
+
+    def frame_sent(self, protocol, opcode, length):
+        self.frames_out[opcode] += 1
+        self.bytes_out[opcode] += length
+
+        buffered = protocol.context.get_write_buffer_size()
+
+        if buffered > self.write_buffer_high_water:
+            self.write_buffer_high_water = buffered
+
+        if self.per_connection is not None:
+            connection = self.per_connection.get(protocol)
+
+            if connection is not None:
+                connection.frames_out += 1
+                connection.bytes_out += length
+
+    def message(self, protocol, message, opcode, elapsed):
+        self.messages[opcode] += 1
+        self.on_message.observe(elapsed)
+
+        if len(message) > self.message_high_water:
+            self.message_high_water = len(message)
+
+        if self.per_connection is not None:
+            connection = self.per_connection.get(protocol)
+
+            if connection is not None:
+                connection.messages += 1
+
+    def dispatch(self, protocol, message, opcode):
+        """
+        Call a plain on_message, timing it
+        """
+        start = time.perf_counter()
+
+        try:
+            protocol.on_message(message, opcode)
+
+        finally:
+            self.message(
+                protocol, message, opcode, time.perf_counter() - start)
+
+    def snapshot(self):
+        def by_opcode(counter):
+            return {OPCODE_NAMES.get(opcode, str(opcode)): count
+                    for opcode, count in counter.items()}
+
+        return {
+            'connections': self.connections,
+            'connections_total': self.connections_total,
+            'frames_in': by_opcode(self.frames_in),
+            'frames_out': by_opcode(self.frames_out),
+            'bytes_in': by_opcode(self.bytes_in),
+            'bytes_out': by_opcode(self.bytes_out),
+            'messages': by_opcode(self.messages),
+            'handshakes': dict(self.handshakes),
+            'close_codes': dict(self.close_codes),
+            'fragmented_messages': self.fragmented_messages,
+            'write_pauses': self.write_pauses,
+            'recv_buffer_high_water': self.recv_buffer_high_water,
+            'write_buffer_high_water': self.write_buffer_high_water,
+            'message_high_water': self.message_high_water,
+            'on_message_seconds': self.on_message.snapshot(),
+        }
+
+    def render_prometheus(self, prefix='aiowebsockets'):
+        """
+        Everything in the Prometheus text exposition format
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name, kind, help, samples):
+            name = '{}_{}'.format(prefix, name)
+            lines.append('# HELP {} {}'.format(name, help))
+            lines.append('# TYPE {} {}'.format(name, kind))
+
+            for labels, value in samples:
+                if labels:
+                    labels = '{' + ','.join(
+                        '{}="{}"'.format(key, label)
+                        for key, label in labels) + '}'
+
+                lines.append('{}{} {}'.format(
+                    name, labels or '', format_value(value)))
+
+        def labelled(label, values):
+            return [(((label, key),), value) for key, value in
+                    sorted(values.items(), key=lambda item: str(item[0]))]
+
+        metric('connections', 'gauge', 'Open connections',
+               [((), snapshot['connections'])])
+        metric('connections_total', 'counter', 'Connections accepted',
+               [((), snapshot['connections_total'])])
+
+        for name, help in (
+                ('frames_in', 'Frames received'),
+                ('frames_out', 'Frames sent'),
+                ('bytes_in', 'Payload bytes received'),
+                ('bytes_out', 'Payload bytes sent'),
+                ('messages', 'Messages passed to on_message')):
+            metric(name + '_total', 'counter', help,
+                   labelled('opcode', snapshot[name]))
+
+        metric('handshakes_total', 'counter', 'Handshakes by result',
+               labelled('result', snapshot['handshakes']))
+        metric('close_codes_total', 'counter', 'Close frames sent by code',
+               labelled('code', snapshot['close_codes']))
+        metric('fragmented_messages_total', 'counter',
+               'Messages received in fragments',
+               [((), snapshot['fragmented_messages'])])
+        metric('write_pauses_total', 'counter',
+               'Times the transport paused writing',
+               [((), snapshot['write_pauses'])])
+
+        for name, help in (
+                ('recv_buffer_high_water', 'Largest receive buffer'),
+                ('write_buffer_high_water', 'Largest write buffer'),
+                ('message_high_water', 'Largest message received')):
+            metric(name + '_bytes', 'gauge', help, [((), snapshot[name])])
+
+        histogram = snapshot['on_message_seconds']
+        name = '{}_on_message_seconds'.format(prefix)
+        lines.append('# HELP {} Time spent in on_message'.format(name))
+        lines.append('# TYPE {} histogram'.format(name))
+
+        for bound, count in histogram['buckets']:
+            lines.append('{}_bucket{{le="{}"}} {}'.format(
+                name, format_value(bound), count))
+
+        lines.append('{}_sum {}'.format(name, format_value(histogram['sum'])))
+        lines.append('{}_count {}'.format(name, histogram['count']))
+
+        return '\n'.join(lines) + '\n'
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+
+    return repr(value) if isinstance(value, float) else str(value)
@@ -0,0 +1,305 @@
+import asyncio
+import collections
+import functools
+import itertools
+import random
+
+from .client_protocol import ClientProtocol
+from .client_protocol import Connect
+from .constants import OPCODES
+
+
+class PooledClientProtocol(ClientProtocol):
+    """
+    A ClientProtocol forwarding its messages to the queue of
+    the ReconnectingClient that opened it.
+    """
+
+    def __init__(self, client, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.client = client
+
+    def on_message(self, message, type):
+        self.client.queue.put_message(self, (self.client, message))
+
+    def connection_lost(self, exc):
+        super().connection_lost(exc)
+        self.client.queue.paused.discard(self)
+
+
+class MessageQueue:
+    """
+    The queue pooled connections put their messages on. Once
+    it holds max_queued_messages, each connection adding to it
+    holds back the rest of its frames and stops reading, until
+    it's down to half of that.
+    """
+
+    def __init__(self, max_queued_messages=ClientProtocol.max_queued_messages):
+        self.messages = collections.deque()
+        self.max_queued_messages = max_queued_messages
+        self.paused = set()
+        self.waiter = None
+
+    def __len__(self):
+        return len(self.messages)
+
+    def put_message(self, protocol, item):
+        self.messages.append(item)
+
+        if self.waiter is not None:
+            if not self.waiter.done():
+                self.waiter.set_result(None)
+
+            self.waiter = None
+
+        if len(self.messages) >= self.max_queued_messages:
+            protocol.hold_frames()
+            self.paused.add(protocol)
+
+    async def get(self):
+        while not self.messages:
+            if self.waiter is None:
+                self.waiter = asyncio.get_event_loop().create_future()
+
+            # Shared by every getter, one being cancelled mustn't
+            # cancel it for the others
+            await asyncio.shield(self.waiter)
+
+        item = self.messages.popleft()
+
+        if self.paused and len(self.messages) <= self.max_queued_messages // 2:
+            paused, self.paused = self.paused, set()
+
+            for protocol in paused:
+                protocol.release_frames()
+
+        return item
+
+
+class ReconnectingClient:
+    """
+    Keeps a websocket open to uri, reconnecting whenever it's
+    lost. Failed attempts are retried after a random delay of up
+    to min_delay * 2 ** attempts seconds, capped at max_delay
+    (full jitter), and every reconnect waits up to min_delay so a
+    server dropping everyone isn't hit by all of them at once.
+
+    Messages received are put on queue, a MessageQueue, as
+    (client, message) pairs, handshakes is an optional
+    asyncio.Semaphore limiting the handshakes in progress. Both
+    are shared by the clients of a ConnectionPool. Without a
+    queue one holding max_queued_messages is made.
+    """
+
+    def __init__(self, uri, deflate_options=None, ssl=None, handshakes=None,
+                 queue=None, min_delay=0.5, max_delay=30.0,
+                 open_timeout=10.0, close_timeout=10.0,
+                 max_queued_messages=ClientProtocol.max_queued_messages):
+        self.connector = Connect(
+            uri, deflate_options, ssl,
+            protocol=functools.partial(PooledClientProtocol, self),
+            open_timeout=open_timeout, close_timeout=close_timeout)
+        self.handshakes = handshakes
+        self.queue = (queue if queue is not None
+                      else MessageQueue(max_queued_messages))
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+
+        self.protocol = None
+        self.connected = asyncio.Event()
+        self.task = None
+        self.attempts = 0
+        self.reconnects = 0
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.ensure_future(self.run())
+
+    def backoff(self):
+        delay = min(self.max_delay, self.min_delay * 2 ** self.attempts)
+        return random.uniform(0, delay)
+
+    async def run(self):
+        while True:
+            try:
+                if self.handshakes is None:
+                    protocol = await self.connector.connect()
+
+                else:
+                    async with self.handshakes:
+                        protocol = await self.connector.connect()
+
+            except (OSError, asyncio.TimeoutError):
+                await asyncio.sleep(self.backoff())
+                self.attempts += 1
+                continue
+
+            self.attempts = 0
+            self.protocol = protocol
+            self.connected.set()
+
+            try:
+                await protocol.closed_event.wait()
+
+            finally:
+                self.protocol = None
+                self.connected.clear()
+
+            self.reconnects += 1
+            await asyncio.sleep(self.backoff())
+
+    async def wait_connected(self):
+        await self.connected.wait()
+        return self.protocol
+
+    def send(self, data, opcode=OPCODES['text']):
+        """
+        Send a message on the current connection, raises
+        ConnectionResetError while reconnecting.
+        """
+        protocol = self.protocol
+
+        if protocol is None or protocol.context.is_closing():
+            raise ConnectionResetError('Not connected')
+
+        protocol.send(data, opcode)
+
+    async def recv(self):
+        """
+        The next message received, over any connection
+        """
+        client, message = await self.queue.get()
+        return message
+
+    async def close(self, status=1000, reason=''):
+        """
+        Stop reconnecting and close the current connection
+        """
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+        protocol = self.protocol
+
+        if protocol is not None:
+            await protocol.close(
+                status, reason, timeout=self.connector.close_timeout)
+
+
+class ConnectionPool:
+    """
+    size ReconnectingClients to uri sharing one SSLContext (ssl,
+    or the shared_ssl_context()), one receive queue and at most
+    max_handshakes handshakes in progress at a time, so a
+    reconnect storm doesn't open every TLS session at once.
+
+    send() spreads messages over the open connections in turn,
+    send_all() sends to every open connection, recv() and async
+    iteration return (client, message) pairs from all of them.
+    Reading is paused while max_queued_messages are waiting.
+    """
+
+    def __init__(self, uri, size=1, deflate_options=None, ssl=None,
+                 max_handshakes=16,
+                 max_queued_messages=ClientProtocol.max_queued_messages,
+                 **kwargs):
+        if size < 1:
+            raise ValueError('size must be at least 1')
+
+        self.queue = MessageQueue(max_queued_messages)
+        self.handshakes = asyncio.Semaphore(max_handshakes)
+        self.clients = [
+            ReconnectingClient(
+                uri, deflate_options, ssl, handshakes=self.handshakes,
+                queue=self.queue, **kwargs)
+            for i in range(size)
+        ]
+        self.next_client = itertools.cycle(self.clients)
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.queue.get()
+
+    def start(self):
+        for client in self.clients:
+            client.start()
+
+    @property
+    def connected(self):
+        return [client for client in self.clients
+                if client.protocol is not None]
+
+    async def wait_connected(self, count=1):
+        """
+        Wait for at least count open connections
+        """
+        count = min(count, len(self.clients))
+
+        while len(self.connected) < count:
+            waiters = [asyncio.ensure_future(client.connected.wait())
+                       for client in self.clients if client.protocol is None]
+
+            try:
+                await asyncio.wait(
+                    waiters, return_when=asyncio.FIRST_COMPLETED)
+
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+    def send(self, data, opcode=OPCODES['text']):
+        """
+        Send a message over the next open connection, raises
+        ConnectionResetError when none are open.
+        """
+        for i in range(len(self.clients)):
+            client = next(self.next_client)
+
+            try:
+                return client.send(data, opcode)
+
+            except ConnectionResetError:
+                continue
+
+        raise ConnectionResetError('No open connections')
+
+    def send_all(self, data, opcode=OPCODES['text']):
+        """
+        Send a message over every open connection, returning
+        how many it was sent to.
+        """
+        sent = 0
+
+        for client in self.clients:
+            try:
+                client.send(data, opcode)
+                sent += 1
+
+            except ConnectionResetError:
+                pass
+
+        return sent
+
+    async def recv(self):
+        return await self.queue.get()
+
+    async def close(self, status=1000, reason=''):
+        await asyncio.gather(
+            *(client.close(status, reason) for client in self.clients))
@@ -0,0 +1,299 @@
+import asyncio
+import collections
+import logging
+import time
+
+from .constants import Flags
+from .framing import EncodeFrame
+from .framing import EncodeHeader
+from .framing import validate_utf8
+
+
+logger = logging.getLogger(__name__)
+
+# Phases timed, in the order they're reported
+PHASES = ('decode', 'mask', 'inflate', 'utf8', 'handle', 'on_message',
+          'encode', 'write', 'loop_lag')
+
+
+class Profiler:
+    """
+    Samples where the time goes, for the protocols it's assigned
+    to (Protocol.profiler). Every 1 / sample_rate frames received
+    or sent is timed per phase:
+
+     - decode: parsing the frame, without unmasking
+     - mask: unmasking the payload
+     - inflate: decompressing permessage-deflate payloads
+     - utf8: validating text payloads and close reasons
+     - handle: the rest of the frame handler, without
+       on_message
+     - on_message: plain (not coroutine) on_message calls
+     - encode, write: encoding a frame and writing it
+
+    Every plain on_message call is timed while enabled, the ones
+    blocking the loop longer than slow_threshold seconds are logged
+    with the protocol class, peer and message size, and kept in
+    slow_callbacks. With lag_interval set the loop is woken every
+    lag_interval seconds to measure how late it runs, lags above
+    lag_threshold are logged too.
+
+    Each phase keeps its last samples durations, report() sums
+    them up. Switch it with enable() and disable() at any time,
+    disabled it costs a single check per read and send.
+    """
+
+    def __init__(self, sample_rate=0.01, slow_threshold=0.1,
+                 lag_interval=None, lag_threshold=0.1, samples=4096,
+                 loop=None):
+        if not 0 < sample_rate <= 1:
+            raise ValueError('sample_rate must be within (0, 1]')
+
+        self.sample_interval = max(1, round(1 / sample_rate))
+        self.slow_threshold = slow_threshold
+        self.lag_interval = lag_interval
+        self.lag_threshold = lag_threshold
+        self.loop = loop
+        self.enabled = False
+
+        self.phases = {
+            phase: collections.deque(maxlen=samples) for phase in PHASES
+        }
+        self.slow_callbacks = collections.deque(maxlen=100)
+
+        self.receive_countdown = self.sample_interval
+        self.send_countdown = self.sample_interval
+
+        # Set while a sampled frame is handled, with the time spent
+        # in on_message, inflating and validating it so far
+        self.sampling = False
+        self.on_message_seconds = 0.0
+        self.inflate_seconds = 0.0
+        self.utf8_seconds = 0.0
+
+        self.lag_handle = None
+        self.lag_expected = None
+
+    def enable(self):
+        self.enabled = True
+
+        if self.lag_interval is not None and self.lag_handle is None:
+            self.schedule_lag_check()
+
+    def disable(self):
+        self.enabled = False
+
+        if self.lag_handle is not None:
+            self.lag_handle.cancel()
+            self.lag_handle = None
+
+    def clear(self):
+        for samples in self.phases.values():
+            samples.clear()
+
+        self.slow_callbacks.clear()
+
+    def frames_received(self, protocol, frames):
+        """
+        Wraps the frames iterated by Protocol.process_frames,
+        timing the decoding and handling of sampled frames.
+        """
+        decoder = protocol.frame_decoder
+        perf_counter = time.perf_counter
+        phases = self.phases
+        iterator = iter(frames)
+
+        while True:
+            self.receive_countdown -= 1
+
+            if self.receive_countdown:
+                try:
+                    frame = next(iterator)
+
+                except StopIteration:
+                    return
+
+                yield frame
+                continue
+
+            self.receive_countdown = self.sample_interval
+            decoder.timed = 1
+            decoder.mask_seconds = 0
+            start = perf_counter()
+
+            try:
+                frame = next(iterator)
+
+            except StopIteration:
+                return
+
+            finally:
+                decoded = perf_counter()
+                decoder.timed = 0
+
+            mask = decoder.mask_seconds
+            phases['mask'].append(mask)
+            phases['decode'].append(decoded - start - mask)
+
+            self.on_message_seconds = 0.0
+            self.inflate_seconds = 0.0
+            self.utf8_seconds = 0.0
+            self.sampling = True
+
+            try:
+                yield frame
+
+            finally:
+                self.sampling = False
+
+            phases['handle'].append(
+                perf_counter() - decoded - self.on_message_seconds -
+                self.inflate_seconds - self.utf8_seconds)
+
+    def on_message(self, protocol, message, opcode):
+        """
+        Call a plain on_message, timing it
+        """
+        start = time.perf_counter()
+
+        try:
+            protocol.on_message(message, opcode)
+
+        finally:
+            elapsed = time.perf_counter() - start
+            self.on_message_seconds += elapsed
+            self.phases['on_message'].append(elapsed)
+
+            if elapsed >= self.slow_threshold:
+                self.slow_callback(protocol, message, opcode, elapsed)
+
+    def inflate(self, deflate, data, final, max_length):
+        """
+        Decompress a sampled frame's payload, timing it
+        """
+        start = time.perf_counter()
+
+        try:
+            return deflate.decompress(data, final, max_length)
+
+        finally:
+            elapsed = time.perf_counter() - start
+            self.inflate_seconds += elapsed
+            self.phases['inflate'].append(elapsed)
+
+    def check_utf8(self, data, validator, final):
+        """
+        Validate a sampled frame's text as utf-8, timing it
+        """
+        start = time.perf_counter()
+
+        try:
+            if validator is None:
+                validate_utf8(data)
+
+            else:
+                validator.validate(data, final)
+
+        finally:
+            elapsed = time.perf_counter() - start
+            self.utf8_seconds += elapsed
+            self.phases['utf8'].append(elapsed)
+
+    def slow_callback(self, protocol, message, opcode, elapsed):
+        context = protocol.context
+        peer = None
+
+        if context is not None:
+            peer = context.get_extra_info('peername')
+
+        record = {
+            'protocol': type(protocol).__qualname__,
+            'peer': peer,
+            'opcode': opcode,
+            'size': len(message),
+            'seconds': elapsed,
+        }
+        self.slow_callbacks.append(record)
+
+        logger.warning(
+            '%s.on_message blocked the loop for %.3f seconds '
+            '(peer %s, %d byte message)', record['protocol'], elapsed,
+            peer, record['size'])
+
+    def sample_send(self):
+        self.send_countdown -= 1
+
+        if self.send_countdown:
+            return False
+
+        self.send_countdown = self.sample_interval
+        return True
+
+    def send_frame(self, protocol, data, opcode, rsv, fin, batch=None):
+        """
+        Encode and write (or add to batch) a sampled frame the
+        same way as Protocol.send_frame, timing each half.
+        """
+        start = time.perf_counter()
+
+        if protocol.flags & Flags.MASK_DATA:
+            frame = (EncodeFrame(data, fin, opcode, mask=True, rsv=rsv),)
+
+        elif len(data) <= protocol.small_frame_length:
+            frame = (EncodeFrame(data, fin, opcode, rsv=rsv),)
+
+        else:
+            frame = (EncodeHeader(data, fin, opcode, rsv), data)
+
+        encoded = time.perf_counter()
+
+        if batch is None:
+            protocol.context.writelines(frame)
+
+        else:
+            batch.extend(frame)
+
+        self.phases['encode'].append(encoded - start)
+        self.phases['write'].append(time.perf_counter() - encoded)
+
+    def schedule_lag_check(self):
+        loop = self.loop or asyncio.get_event_loop()
+        self.lag_expected = loop.time() + self.lag_interval
+        self.lag_handle = loop.call_later(self.lag_interval, self.lag_check)
+
+    def lag_check(self):
+        loop = self.loop or asyncio.get_event_loop()
+        lag = max(0.0, loop.time() - self.lag_expected)
+        self.phases['loop_lag'].append(lag)
+
+        if lag >= self.lag_threshold:
+            logger.warning('Event loop ran %.3f seconds late', lag)
+
+        self.schedule_lag_check()
+
+    def report(self):
+        """
+        count, mean, p50, p99 and max of every phase sampled,
+        in microseconds.
+        """
+        report = {}
+
+        for phase in PHASES:
+            samples = sorted(self.phases[phase])
+
+            if not samples:
+                continue
+
+            def percentile(fraction):
+                return samples[min(len(samples) - 1,
+                                   int(len(samples) * fraction))] * 1e6
+
+            report[phase] = {
+                'count': len(samples),
+                'mean': sum(samples) / len(samples) * 1e6,
+                'p50': percentile(0.5),
+                'p99': percentile(0.99),
+                'max': samples[-1] * 1e6,
+            }
+
+        return report
@@ -1,11 +1,13 @@
 import asyncio
+import collections
 import socket
-import codecs
 import struct
+import time
 import urllib.parse
 
 from .constants import Flags, STATUS_CODES, VALID_STATUS_CODES, OPCODES
-from .constants import MAX_BUFFER_LENGTH
+from .constants import MAX_FRAME_LENGTH, MAX_MESSAGE_LENGTH
+from .constants import MAX_BUFFER_LENGTH, RSV1, WRITE_LIMIT_POLICIES
 from .handshake import Handshake
 from .exception import IncompleteFrame
 from .exception import CloseFrame
@@ -13,9 +15,135 @@ from .exception import ProtocolError
 from .exception import BufferExceeded
 from .framing import FrameDecoder
 from .framing import EncodeFrame
+from .framing import EncodeHeader
+from .framing import Utf8Validator
+from .framing import validate_utf8
+from .keepalive import get_wheel
+from .utils import frame_header_length
+from .utils import read_fragments
 
 
 class Protocol(asyncio.Protocol):
+    # Per connection state, subclasses which declare __slots__ too
+    # don't get a __dict__, saving memory on idle connections
+    __slots__ = (
+        '__weakref__', 'context', 'header', 'flags',
+        'recv_buffer', 'frame_decoder', 'header_search',
+        'frag_decoder', 'frag_buffer', 'frag_opcode', 'frag_compressed',
+        'deflate', 'drain_waiter', 'write_limit_handle',
+        'pending_messages', 'dispatch_task', 'deferred_messages',
+        'stream_lock', 'keepalive', 'keepalive_slot', 'last_read',
+        'ping_sent', 'write_batch', 'flush_handle', 'message_batch',
+        'budget_handle', 'budget_tokens', 'budget_stamp',
+    )
+
+    # Unmasked payloads up to this size are copied into a single
+    # buffer with their header, larger ones are written as is
+    small_frame_length = 1024
+
+    # permessage-deflate settings (a DeflateOptions), None disables it
+    deflate_options = None
+
+    # Transport write buffer watermarks, writing is paused above
+    # write_high_water and resumed below write_low_water
+    write_high_water = 64 * 1024
+    write_low_water = 16 * 1024
+
+    # Connections paused for longer than write_timeout seconds are
+    # handled by write_limit_exceeded according to write_limit_policy:
+    #  - wait: nothing happens, send_async/drain keep waiting
+    #  - drop: messages are dropped until writing resumes
+    #  - close: the connection is closed with 1008
+    write_limit_policy = 'wait'
+    write_timeout = 10.0
+
+    # Messages waiting for an async on_message before reading is paused
+    max_pending_messages = 64
+
+    # Whether on_message is a coroutine, resolved once per class
+    async_on_message = False
+
+    # Deliver messages through on_message_start, on_message_chunk and
+    # on_message_end as they arrive instead of buffering them whole
+    stream_messages = False
+
+    # Deliver every message of a read at once to on_messages, as
+    # a list of (message, opcode), unless stream_messages is set
+    batch_messages = False
+
+    # Pass whole text messages as str rather than validated bytearrays,
+    # decoding them once
+    decode_text = False
+
+    # Largest handshake accepted, larger ones are refused with a 431
+    max_header_length = 8192
+
+    # Receive limits in bytes, going over any of them closes the
+    # connection with 1009. Frames and fragmented messages are
+    # refused from their header, before their payload is buffered.
+    # Compressed messages are limited once inflated. Change them
+    # for a single connection with set_size_limits().
+    max_frame_size = MAX_FRAME_LENGTH
+    max_message_size = MAX_MESSAGE_LENGTH
+    max_buffer_size = MAX_BUFFER_LENGTH
+
+    # Keepalive, None disables each of them:
+    #  - ping_interval: ping after this many seconds without receiving
+    #    anything, the connection is aborted if the pong doesn't
+    #    arrive within ping_timeout
+    #  - idle_timeout: close with 1001 after this many seconds
+    #    without receiving anything, handshake included
+    # Every connection on a loop shares keepalive_wheel, or the
+    # loop's default TimerWheel when None.
+    ping_interval = None
+    ping_timeout = 20.0
+    idle_timeout = None
+    keepalive_wheel = None
+
+    # Corked mode, data frames sent are gathered and written at once
+    # at the end of data_received or on the next loop iteration.
+    # Control frames aren't held back.
+    cork_writes = False
+
+    # A ReadBudget limiting the frames handled per read and their
+    # rate, None disables it
+    read_budget = None
+
+    # A Metrics instance counting for every connection, None disables it
+    metrics = None
+
+    # A Profiler sampling phase timings and reporting slow on_message
+    # calls, None disables it
+    profiler = None
+
+    # Frame handler method names by opcode, resolved once per class
+    # into opcode_handlers, and stream_handlers for stream_messages
+    handler_names = {
+        OPCODES['stream']: 'handle_stream_frame',
+        OPCODES['text']: 'handle_binary_frame',
+        OPCODES['binary']: 'handle_binary_frame',
+        OPCODES['close']: 'handle_close_frame',
+        OPCODES['ping']: 'handle_ping_frame',
+        OPCODES['pong']: 'handle_pong_frame',
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.async_on_message = asyncio.iscoroutinefunction(
+            getattr(cls, 'on_message', None))
+        cls.resolve_handlers()
+
+    @classmethod
+    def resolve_handlers(cls):
+        cls.opcode_handlers = {
+            opcode: getattr(cls, name)
+            for opcode, name in cls.handler_names.items()
+        }
+
+        cls.stream_handlers = dict(cls.opcode_handlers)
+
+        for opcode in ('stream', 'text', 'binary'):
+            cls.stream_handlers[OPCODES[opcode]] = cls.handle_message_chunk
 
     def set_nodelay(self):
         """
@@ -27,11 +155,51 @@ class Protocol(asyncio.Protocol):
 
     def create_buffers(self):
         self.recv_buffer = bytearray()
-        self.frag_decoder = codecs.getincrementaldecoder('utf-8')()
-        self.frag_buffer = bytearray()
+        self.frag_decoder = None
+        self.frag_buffer = None
         self.frag_opcode = None
+        self.frag_compressed = False
+        self.deflate = None
         self.flags = Flags.AWAITING_HANDSHAKE
+        self.header_search = 0
         self.frame_decoder = FrameDecoder(self.recv_buffer)
+        self.frame_decoder.streaming = self.stream_messages
+        self.frame_decoder.decode_text = self.decode_text
+        self.set_size_limits(
+            self.max_frame_size, self.max_message_size, self.max_buffer_size)
+        self.drain_waiter = None
+        self.write_limit_handle = None
+        self.pending_messages = None
+        self.dispatch_task = None
+        self.deferred_messages = None
+        self.stream_lock = None
+        self.keepalive = None
+        self.keepalive_slot = None
+        self.last_read = 0.0
+        self.ping_sent = None
+        self.write_batch = None
+        self.flush_handle = None
+        self.message_batch = None
+        self.budget_handle = None
+        self.budget_tokens = None
+        self.budget_stamp = 0.0
+
+    def set_size_limits(self, max_frame_size=None, max_message_size=None,
+                        max_buffer_size=None):
+        """
+        Change the receive limits of this connection only,
+        the ones left as None are kept.
+        """
+        decoder = self.frame_decoder
+
+        if max_frame_size is not None:
+            decoder.max_payload = max_frame_size
+
+        if max_message_size is not None:
+            decoder.max_message = max_message_size
+
+        if max_buffer_size is not None:
+            decoder.max_buffer = max_buffer_size
 
     def connection_made(self, context):
         """
@@ -43,57 +211,432 @@ class Protocol(asyncio.Protocol):
         self.set_nodelay()
         self.create_buffers()
 
-        self.opcode_handlers = {
-            OPCODES['stream']: self.handle_stream_frame,
-            OPCODES['text']: self.handle_binary_frame,
-            OPCODES['binary']: self.handle_binary_frame,
-            OPCODES['close']: self.handle_close_frame,
-            OPCODES['ping']: self.handle_ping_frame,
-            OPCODES['pong']: lambda x: None
-        }
+        if self.write_limit_policy not in WRITE_LIMIT_POLICIES:
+            raise ValueError('Unknown write_limit_policy {}'.format(
+                self.write_limit_policy))
+
+        context.set_write_buffer_limits(
+            self.write_high_water, self.write_low_water)
+
+        if self.metrics is not None:
+            self.metrics.connection_made(self)
+
+        if self.ping_interval is not None or self.idle_timeout is not None:
+            self.start_keepalive()
+
+    def connection_lost(self, exc):
+        """
+        Wake anything waiting in drain, subclasses overriding
+        this should call super().connection_lost(exc).
+        """
+        self.resume_writing()
+
+        if self.keepalive is not None:
+            self.keepalive.discard(self)
+
+        if self.metrics is not None:
+            self.metrics.connection_lost(self)
+
+        if self.write_batch is not None:
+            self.flush_writes()
+
+        if self.budget_handle is not None:
+            self.budget_handle.cancel()
+            self.budget_handle = None
+
+    def start_keepalive(self):
+        self.keepalive = self.keepalive_wheel or get_wheel()
+        self.last_read = self.keepalive.loop.time()
+        self.keepalive.add(self, self.keepalive_check(self.last_read))
+
+    def keepalive_check(self, now):
+        """
+        Called by the TimerWheel once one of our deadlines may have
+        passed, pings or closes the connection when they have and
+        returns the next deadline.
+        """
+        if self.context.is_closing():
+            return None
+
+        deadlines = []
+
+        if self.idle_timeout is not None:
+            deadline = self.last_read + self.idle_timeout
+
+            if now >= deadline:
+                if self.flags & Flags.HANDSHAKE_COMPLETE:
+                    self.close_websocket(
+                        STATUS_CODES['going-away'], 'Idle Timeout')
+
+                else:
+                    self.context.close()
+
+                return None
+
+            deadlines.append(deadline)
+
+        if self.ping_sent is not None:
+            deadline = self.ping_sent + self.ping_timeout
+
+            # No pong, there's nobody left to close the connection
+            # with, so it's dropped without a close frame (1006)
+            if now >= deadline:
+                self.context.abort()
+                return None
+
+            deadlines.append(deadline)
+
+        elif self.ping_interval is not None:
+            deadline = self.last_read + self.ping_interval
+
+            if now >= deadline:
+                if self.flags & Flags.HANDSHAKE_COMPLETE:
+                    self.ping()
+                    deadline = now + self.ping_timeout
+
+                else:
+                    deadline = now + self.ping_interval
+
+            deadlines.append(deadline)
+
+        return min(deadlines) if deadlines else None
+
+    def ping(self, data=b''):
+        """
+        Send a ping, ping_timeout applies when keepalive is enabled
+        """
+        if self.keepalive is not None:
+            self.ping_sent = self.keepalive.now
+
+        self.send_frame(data, OPCODES['ping'])
+
+    def pause_writing(self):
+        """
+        The transport's write buffer went over write_high_water
+        """
+        self.flags |= Flags.WRITE_PAUSED
+
+        if self.metrics is not None:
+            self.metrics.write_pauses += 1
+
+        if self.write_limit_policy != 'wait':
+            self.write_limit_handle = asyncio.get_event_loop().call_later(
+                self.write_timeout, self.write_limit_exceeded)
+
+    def resume_writing(self):
+        """
+        The transport's write buffer drained below write_low_water
+        """
+        self.flags &= ~(Flags.WRITE_PAUSED | Flags.DROP_WRITES)
+
+        if self.write_limit_handle is not None:
+            self.write_limit_handle.cancel()
+            self.write_limit_handle = None
+
+        if self.drain_waiter is not None:
+            if not self.drain_waiter.done():
+                self.drain_waiter.set_result(None)
+
+            self.drain_waiter = None
+
+    def write_limit_exceeded(self):
+        """
+        Writing has been paused for write_timeout seconds,
+        override to handle slow readers differently.
+        """
+        self.write_limit_handle = None
+
+        if self.write_limit_policy == 'drop':
+            self.flags |= Flags.DROP_WRITES
+
+        elif self.write_limit_policy == 'close':
+            self.close_websocket(
+                STATUS_CODES['policy-violation'], 'Write Buffer Exceeded')
+
+    def pause_reading(self, reason):
+        """
+        Pause reading from the transport until every
+        reason (a Flags.READING_PAUSED bit) is resumed.
+        """
+        if not self.flags & Flags.READING_PAUSED:
+            self.context.pause_reading()
+
+        self.flags |= reason
+
+    def resume_reading(self, reason):
+        if not self.flags & reason:
+            return
+
+        self.flags &= ~reason
+
+        if not self.flags & Flags.READING_PAUSED:
+            self.context.resume_reading()
+
+    async def drain(self):
+        """
+        Wait until the transport's write buffer drops
+        below write_low_water.
+        """
+        if self.context.is_closing():
+            raise ConnectionResetError('Connection lost')
+
+        if not self.flags & Flags.WRITE_PAUSED:
+            return
+
+        if self.drain_waiter is None:
+            self.drain_waiter = asyncio.get_event_loop().create_future()
+
+        await asyncio.shield(self.drain_waiter)
+
+        if self.context.is_closing():
+            raise ConnectionResetError('Connection lost')
 
     def data_received(self, data):
         """
         Respond to WebSocket handshake requests and then iterate
         over websocket frames.
         """
+        if self.keepalive is not None:
+            self.last_read = self.keepalive.now
+
         if self.flags & Flags.HANDSHAKE_COMPLETE:
-            try:
-                if len(data) + len(self.recv_buffer) > MAX_BUFFER_LENGTH:
-                    raise BufferExceeded
+            self.recv_buffer.extend(data)
+            self.frame_decoder.feed(len(data))
+            self.process_frames()
+            self.frame_decoder.compact()
+
+            if self.write_batch is not None:
+                self.flush_writes()
+
+        else:
+            self.recv_buffer.extend(data)
+            self.shake_hands()
+
+            # Frames pipelined after the handshake arrived with it
+            if self.flags & Flags.HANDSHAKE_COMPLETE and self.recv_buffer:
+                self.frame_decoder.feed(len(self.recv_buffer))
+                self.process_frames()
+                self.frame_decoder.compact()
+
+                if self.write_batch is not None:
+                    self.flush_writes()
+
+    def find_header_end(self):
+        """
+        Find the end of the HTTP header in recv_buffer, resuming
+        the search where the previous read left off. Returns 0
+        until the whole header has arrived, raises BufferExceeded
+        when it's longer than max_header_length.
+        """
+        buffer = self.recv_buffer
+        header_end = buffer.find(b'\r\n\r\n', self.header_search)
+
+        if header_end == -1:
+            if len(buffer) > self.max_header_length:
+                raise BufferExceeded
+
+            # The terminator may straddle this read and the next
+            self.header_search = max(0, len(buffer) - 3)
+            return 0
+
+        header_end += 4
+
+        if header_end > self.max_header_length:
+            raise BufferExceeded
+
+        self.header_search = 0
+        return header_end
+
+    def process_frames(self):
+        """
+        Dispatch every complete frame the decoder has been fed
+        to its opcode handler.
+        """
+        try:
+            decoder = self.frame_decoder
+            handlers = (self.stream_handlers if self.stream_messages
+                        else self.opcode_handlers)
+
+            if (decoder.max_buffer and
+                    decoder.end - decoder.offset > decoder.max_buffer):
+                raise BufferExceeded
+
+            frames = decoder
+
+            if self.metrics is not None:
+                frames = self.metrics.frames_received(self, decoder)
+
+            if self.profiler is not None and self.profiler.enabled:
+                frames = self.profiler.frames_received(self, frames)
+
+            if self.read_budget is not None:
+                frames = self.read_budget.frames_received(self, frames)
+
+            if self.batch_messages and not self.stream_messages:
+                self.process_batch(frames, handlers)
+                return
+
+            for frame in frames:
+                handler = handlers.get(frame.opcode)
+
+                if handler is None:
+                    raise ProtocolError('Unknown Opcode')
+
+                if frame.rsv:
+                    self.check_rsv(frame)
+
+                handler(self, frame)
+
+                # The rest is handled once the flag is cleared
+                if self.flags & Flags.HOLD_FRAMES:
+                    break
+
+        except ProtocolError:
+            self.close_websocket(STATUS_CODES['protocol-error'])
+
+        except UnicodeDecodeError:
+            self.close_websocket(
+                STATUS_CODES['inconsistent-type'], "Invalid UTF-8 Data")
+
+        except BufferExceeded:
+            self.close_websocket(
+                STATUS_CODES['buffer-exceeded'], "Buffer Exceeded")
+
+        except CloseFrame as frame:
+            self.close_websocket(frame.status, frame.reason)
+
+        except KeyboardInterrupt:
+            asyncio.get_event_loop().stop()
 
-                self.recv_buffer.extend(data)
+    def process_batch(self, frames, handlers):
+        """
+        process_frames for batch_messages, the messages dispatched
+        while handling the frames are gathered and passed to
+        on_messages at once.
+        """
+        decoder = self.frame_decoder
+        batch = self.message_batch = []
+
+        try:
+            if frames is decoder:
+                # Whole messages are decoded in a single call, which
+                # stops at the frames the handlers have to deal with.
+                # Within a fragmented message every frame goes to the
+                # handlers, so out of place data frames are refused.
+                while True:
+                    if self.flags & Flags.FRAGMENTATION_STARTED:
+                        if next(decoder, None) is None:
+                            break
+
+                    elif not decoder.decode_messages(batch):
+                        break
+
+                    self.handle_frame(decoder, handlers)
+
+            else:
+                for frame in frames:
+                    self.handle_frame(frame, handlers)
+
+        finally:
+            self.message_batch = None
+
+            if batch:
+                self.dispatch_batch(batch)
+
+    def handle_frame(self, frame, handlers):
+        handler = handlers.get(frame.opcode)
+
+        if handler is None:
+            raise ProtocolError('Unknown Opcode')
 
-                for frame in self.frame_decoder:
-                    if frame.opcode not in self.opcode_handlers:
-                        raise ProtocolError('Unknown Opcode')
+        if frame.rsv:
+            self.check_rsv(frame)
 
-                    if frame.rsv:
-                        raise ProtocolError('RSV Bit Must Not Be Set')
+        handler(self, frame)
 
-                    self.opcode_handlers[frame.opcode](frame)
-                    del self.recv_buffer[:len(frame)]
+    def defer_frames(self, delay):
+        """
+        The read budget is spent, pause reading and handle
+        the frames left after delay seconds, or on the next
+        loop iteration.
+        """
+        self.pause_reading(Flags.BUDGET_PAUSED)
+
+        if self.budget_handle is None:
+            loop = asyncio.get_event_loop()
 
-            except ProtocolError:
-                self.close_websocket(STATUS_CODES['protocol-error'])
+            if delay:
+                self.budget_handle = loop.call_later(
+                    delay, self.resume_frames)
 
-            except UnicodeDecodeError:
-                self.close_websocket(
-                    STATUS_CODES['inconsistent-type'], "Invalid UTF-8 Data")
+            else:
+                self.budget_handle = loop.call_soon(self.resume_frames)
+
+    def resume_frames(self):
+        self.budget_handle = None
 
-            except BufferExceeded:
-                self.close_websocket(
-                    STATUS_CODES['buffer-exceeded'], "Buffer Exceeded")
+        if self.context.is_closing():
+            return
 
-            except CloseFrame as frame:
-                self.close_websocket(frame.status, frame.reason)
+        self.handle_held_frames()
 
-            except KeyboardInterrupt:
-                asyncio.get_event_loop().stop()
+        # Unless the budget ran out again
+        if self.budget_handle is None:
+            self.resume_reading(Flags.BUDGET_PAUSED)
+
+    def handle_held_frames(self):
+        """
+        Handle the frames left in the receive buffer
+        while reading was paused.
+        """
+        self.process_frames()
+        self.compact_buffer()
+
+        if self.write_batch is not None:
+            self.flush_writes()
+
+    def compact_buffer(self):
+        """
+        Drop the frames consumed from the receive buffer
+        """
+        self.frame_decoder.compact()
+
+    def check_utf8(self, data, validator=None, final=True):
+        """
+        Validate data as utf-8, with validator for fragments,
+        timed for the frames sampled by the profiler.
+        """
+        profiler = self.profiler
+
+        if profiler is not None and profiler.sampling:
+            profiler.check_utf8(data, validator, final)
+
+        elif validator is None:
+            validate_utf8(data)
 
         else:
-            self.recv_buffer.extend(data)
-            self.shake_hands()
+            validator.validate(data, final)
+
+    def inflate(self, data, final, max_length):
+        """
+        Decompress a message or fragment, timed for the frames
+        sampled by the profiler.
+        """
+        profiler = self.profiler
+
+        if profiler is not None and profiler.sampling:
+            return profiler.inflate(self.deflate, data, final, max_length)
+
+        return self.deflate.decompress(data, final, max_length)
+
+    def check_rsv(self, frame):
+        """
+        RSV1 marks the first frame of a compressed message,
+        only allowed once permessage-deflate is negotiated.
+        """
+        if (self.deflate is None or frame.rsv != RSV1 or
+                frame.opcode not in (OPCODES['text'], OPCODES['binary'])):
+            raise ProtocolError('RSV Bit Must Not Be Set')
 
     def handle_binary_frame(self, frame):
         '''
@@ -108,29 +651,39 @@ class Protocol(asyncio.Protocol):
             raise ProtocolError('Expected fragment/chunk with opcode 0')
 
         else:
+            data = frame.data
+
+            if frame.rsv:
+                max_message = self.frame_decoder.max_message
+                data = self.inflate(data, True, max_message)
+
+                if max_message and len(data) > max_message:
+                    raise BufferExceeded
+
             if frame.opcode == OPCODES['text']:
                 """
-                We decode to verify that it's valid utf8 here, but because
-                we treat everything as a bytearray, we don't want the
-                resulting bytes object.
+                We only verify that it's valid utf8 here, without
+                decoding it, unless a str is wanted anyway.
                 """
-                frame.data.decode('utf-8')
+                if self.decode_text:
+                    data = data.decode('utf-8')
 
-            if asyncio.iscoroutinefunction(self.on_message):
-                asyncio.ensure_future(
-                    self.on_message(frame.data, frame.opcode)
-                )
+                else:
+                    self.check_utf8(data)
 
-            else:
-                self.on_message(frame.data, frame.opcode)
+            self.dispatch(data, frame.opcode)
 
     def handle_ping_frame(self, frame):
         if not frame.fin:
             raise ProtocolError('Control frames must not be fragmented')
 
-        self.context.write(
-            EncodeFrame(frame.data, 1, OPCODES['pong'])
-        )
+        self.send_frame(frame.data, OPCODES['pong'])
+
+    def handle_pong_frame(self, frame):
+        if not frame.fin:
+            raise ProtocolError('Control frames must not be fragmented')
+
+        self.ping_sent = None
 
     def handle_close_frame(self, frame):
         """
@@ -145,7 +698,7 @@ class Protocol(asyncio.Protocol):
                 status = STATUS_CODES['protocol-error']
 
             reason = frame.data[2:]
-            reason.decode('utf-8')
+            self.check_utf8(reason)
 
         elif length == 1:
             status = STATUS_CODES['protocol-error']
@@ -159,22 +712,26 @@ class Protocol(asyncio.Protocol):
         if frame.opcode in OPCODES['control']:
             raise ProtocolError('Control messages cannot be fragmented')
 
-        # reset our flags and buffer
-        self.frag_decoder.reset()
-        self.flags |= Flags.FRAGMENTATION_STARTED
-        self.frag_opcode = frame.opcode
+        self.start_fragments(frame)
 
-        # Attempt to decode(verify) it, if it's a text frame
-        if frame.opcode == OPCODES['text']:
-            self.frag_decoder.decode(
-                frame.data, final=False)
+        if self.metrics is not None:
+            self.metrics.fragmented_messages += 1
+
+        data = frame.data
+        max_message = self.frame_decoder.max_message
+
+        if self.frag_compressed:
+            data = self.inflate(data, False, max_message)
 
-        # Max Buffer length
-        if len(frame.data) > MAX_BUFFER_LENGTH:
-            raise BufferExceeded()
+            if max_message and len(data) > max_message:
+                raise BufferExceeded
+
+        # Verify it's valid utf-8 so far, if it's a text frame
+        if frame.opcode == OPCODES['text']:
+            self.check_utf8(data, self.frag_decoder, final=False)
 
-        # Append fragment to the buffer
-        self.frag_buffer.extend(frame.data)
+        # The fragment is a bytearray of our own, it becomes the buffer
+        self.frag_buffer = data
 
     def handle_stream_frame(self, frame):
         """
@@ -183,47 +740,479 @@ class Protocol(asyncio.Protocol):
         if not self.flags & Flags.FRAGMENTATION_STARTED:
             raise ProtocolError('Received continuation before fin=0')
 
-        # Decode if it's text frame, to make sure valid utf-8
-        if self.frag_opcode == OPCODES['text']:
-            self.frag_decoder.decode(frame.data, final=frame.fin)
+        data = frame.data
 
-        # Verify buffer Length
-        if len(frame.data) + len(self.frag_buffer) > MAX_BUFFER_LENGTH:
-            raise BufferExceeded
+        # The decoder limits the message's length on the wire,
+        # compressed messages are limited as they're inflated
+        max_message = self.frame_decoder.max_message
+
+        if self.frag_compressed and not max_message:
+            data = self.inflate(data, frame.fin, 0)
+
+        elif self.frag_compressed:
+            allowed = max_message - len(self.frag_buffer)
+
+            # A limit of 0 means none to zlib, a single byte
+            # is enough to tell the message is too long
+            data = self.inflate(data, frame.fin, max(allowed, 1))
+
+            if len(data) > allowed:
+                raise BufferExceeded
+
+        # Validate if it's text frame, to make sure valid utf-8
+        if self.frag_decoder is not None:
+            self.check_utf8(data, self.frag_decoder, final=frame.fin)
 
         # Extend the buffer
-        self.frag_buffer.extend(frame.data)
+        self.frag_buffer.extend(data)
 
         # If last chunk, callback
         if frame.fin:
-            self.flags &= ~Flags.FRAGMENTATION_STARTED
-            buffer = self.frag_buffer.copy()
-            self.frag_buffer.clear()
+            buffer = self.frag_buffer
+
+            if self.decode_text and self.frag_decoder is not None:
+                buffer = buffer.decode('utf-8')
+
+            self.end_fragments()
 
             # Callback
-            if asyncio.iscoroutinefunction(self.on_message):
-                asyncio.ensure_future(
-                    self.on_message(buffer, self.frag_opcode)
-                )
+            self.dispatch(buffer, self.frag_opcode)
+
+    def start_fragments(self, frame):
+        """
+        Fragmentation state only exists while a message is
+        being received, idle connections don't carry it.
+        """
+        self.flags |= Flags.FRAGMENTATION_STARTED
+        self.frag_opcode = frame.opcode
+        self.frag_compressed = bool(frame.rsv)
+
+        if frame.opcode == OPCODES['text']:
+            self.frag_decoder = Utf8Validator()
+
+    def end_fragments(self):
+        self.flags &= ~Flags.FRAGMENTATION_STARTED
+        self.frag_decoder = None
+        self.frag_buffer = None
+
+    def handle_message_chunk(self, frame):
+        """
+        Streaming counterpart to handle_binary_frame and
+        handle_stream_frame, every piece of a message is passed
+        to on_message_chunk as soon as it has been received,
+        including the pieces of a frame which is still arriving.
+        """
+        if frame.chunk_offset == 0:
+            if frame.opcode == OPCODES['stream']:
+                if not self.flags & Flags.FRAGMENTATION_STARTED:
+                    raise ProtocolError('Received continuation before fin=0')
+
+            elif self.flags & Flags.FRAGMENTATION_STARTED:
+                raise ProtocolError('Expected fragment/chunk with opcode 0')
 
             else:
-                self.on_message(buffer, self.frag_opcode)
+                self.start_fragments(frame)
+                self.on_message_start(frame.opcode)
+
+                # Only messages sent in several frames are fragmented
+                if not frame.fin and self.metrics is not None:
+                    self.metrics.fragmented_messages += 1
+
+        final = frame.fin and not frame.partial
+        data = frame.data
+
+        if self.frag_compressed:
+            data = self.inflate(data, final, self.frame_decoder.max_message)
+
+        # Validate if it's text frame, to make sure valid utf-8
+        if self.frag_decoder is not None:
+            self.check_utf8(data, self.frag_decoder, final=final)
+
+        self.on_message_chunk(data)
+
+        if final:
+            self.end_fragments()
+            self.on_message_end()
+
+    def on_message_start(self, opcode):
+        """
+        A message of type opcode begins, stream_messages only
+        """
+        pass
+
+    def on_message_chunk(self, chunk):
+        """
+        The next piece of the current message, stream_messages only
+        """
+        pass
+
+    def on_message_end(self):
+        """
+        The current message is complete, stream_messages only
+        """
+        pass
+
+    def dispatch(self, message, opcode):
+        """
+        Call on_message directly, or queue the message for our
+        worker when on_message is a coroutine. Reading is paused
+        while max_pending_messages are waiting.
+        """
+        if self.message_batch is not None:
+            self.message_batch.append((message, opcode))
+            return
+
+        if not self.async_on_message:
+            if self.metrics is None and self.profiler is None:
+                self.on_message(message, opcode)
+
+            else:
+                self.timed_on_message(message, opcode)
+
+            return
+
+        if self.pending_messages is None:
+            self.pending_messages = collections.deque()
+
+        self.pending_messages.append((message, opcode))
+
+        if self.dispatch_task is None:
+            self.dispatch_task = asyncio.ensure_future(
+                self.dispatch_messages())
+
+        if len(self.pending_messages) >= self.max_pending_messages:
+            self.pause_reading(Flags.DISPATCH_PAUSED)
+
+    def on_messages(self, messages):
+        """
+        The messages of a read in batch_messages mode, a list of
+        (message, opcode), each passed to on_message by default.
+        """
+        for message, opcode in messages:
+            self.dispatch(message, opcode)
+
+    def dispatch_batch(self, batch):
+        # The default on_messages is counted by dispatch
+        if (self.metrics is None or
+                type(self).on_messages is Protocol.on_messages):
+            self.on_messages(batch)
+            return
+
+        start = time.perf_counter()
+
+        try:
+            self.on_messages(batch)
+
+        finally:
+            # The batch's time is shared out evenly between its messages
+            elapsed = (time.perf_counter() - start) / len(batch)
+
+            for message, opcode in batch:
+                self.metrics.message(self, message, opcode, elapsed)
+
+    def timed_on_message(self, message, opcode):
+        """
+        Call a plain on_message through the profiler and metrics
+        """
+        profiler = self.profiler
+
+        if profiler is None or not profiler.enabled:
+            if self.metrics is None:
+                self.on_message(message, opcode)
+
+            else:
+                self.metrics.dispatch(self, message, opcode)
+
+        elif self.metrics is None:
+            profiler.on_message(self, message, opcode)
+
+        else:
+            start = time.perf_counter()
+
+            try:
+                profiler.on_message(self, message, opcode)
+
+            finally:
+                self.metrics.message(
+                    self, message, opcode, time.perf_counter() - start)
+
+    async def dispatch_messages(self):
+        """
+        Await on_message for each pending message in order,
+        the worker exits once the queue is empty.
+        """
+        pending = self.pending_messages
+        resume_length = self.max_pending_messages // 2
+
+        try:
+            while pending:
+                message, opcode = pending.popleft()
+
+                if len(pending) <= resume_length:
+                    self.resume_reading(Flags.DISPATCH_PAUSED)
+
+                try:
+                    if self.metrics is None:
+                        await self.on_message(message, opcode)
+
+                    else:
+                        start = time.perf_counter()
+
+                        try:
+                            await self.on_message(message, opcode)
+
+                        finally:
+                            self.metrics.message(
+                                self, message, opcode,
+                                time.perf_counter() - start)
+
+                except Exception as exc:
+                    asyncio.get_event_loop().call_exception_handler({
+                        'message': 'Unhandled exception in on_message',
+                        'exception': exc,
+                        'protocol': self,
+                    })
+
+        finally:
+            self.dispatch_task = None
+
+            if not pending:
+                self.pending_messages = None
 
     def send(self, data, opcode=OPCODES['text']):
         """
-        Send a text frame
+        Send a text frame, data may be bytes, bytearray or a
+        memoryview. Large unmasked payloads aren't copied, so
+        they must not be modified until they have been written.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                'Invalid data type, expecting bytes, bytearray or memoryview')
+
+        if self.flags & Flags.DROP_WRITES:
+            return
+
+        if self.flags & Flags.SENDING_STREAM:
+            if self.deferred_messages is None:
+                self.deferred_messages = collections.deque()
+
+            self.deferred_messages.append((data, opcode))
+            return
+
+        if self.deflate is not None:
+            self.deflate.send(
+                data, opcode, self.send_frame, self.compression_failed)
+
+        else:
+            self.send_frame(data, opcode)
+
+    def compression_failed(self, exc):
+        """
+        Compressing a message in the executor failed, the
+        peer can't decompress anything we send after it.
+        """
+        asyncio.get_event_loop().call_exception_handler({
+            'message': 'Compressing a message failed',
+            'exception': exc,
+            'protocol': self,
+        })
+
+        if not self.context.is_closing():
+            self.close_websocket(STATUS_CODES['unexpected-exception'])
+
+    def send_many(self, messages, opcode=OPCODES['text']):
+        """
+        Send every message in messages with a single
+        transport write.
+        """
+        if self.write_batch is not None:
+            for message in messages:
+                self.send(message, opcode)
+
+            return
+
+        self.write_batch = []
+
+        try:
+            for message in messages:
+                self.send(message, opcode)
+
+        finally:
+            self.flush_writes()
+
+    def cork(self):
+        """
+        Gather the frames sent until flush_writes(), which is
+        called on the next loop iteration at the latest.
+        """
+        if self.write_batch is None:
+            self.write_batch = []
+
+        if self.flush_handle is None:
+            self.flush_handle = asyncio.get_event_loop().call_soon(
+                self.flush_writes)
+
+        return self.write_batch
+
+    def flush_writes(self):
+        """
+        Write the frames gathered since cork() or by send_many()
+        """
+        batch = self.write_batch
+        self.write_batch = None
+
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+        if batch and not self.context.is_closing():
+            self.context.writelines(batch)
+
+    async def send_async(self, data, opcode=OPCODES['text']):
+        """
+        Send a frame and wait for the write buffer to drain
+        """
+        self.send(data, opcode)
+        await self.drain()
+
+    def write(self, frame):
+        """
+        Write an already encoded frame, data frames written
+        during send_stream are held back like send() messages.
+        """
+        if self.flags & Flags.SENDING_STREAM and not frame[0] & 0x08:
+            if self.deferred_messages is None:
+                self.deferred_messages = collections.deque()
+
+            self.deferred_messages.append((frame, None))
+            return
+
+        if not self.flags & Flags.DROP_WRITES:
+            if self.write_batch is None:
+                self.context.write(frame)
+
+            else:
+                self.write_batch.append(frame)
+
+            if self.metrics is not None:
+                self.metrics.frame_sent(
+                    self, frame[0] & 0x0f,
+                    len(frame) - frame_header_length(frame))
+
+    async def send_stream(self, source, opcode=OPCODES['binary'],
+                          fragment_size=64 * 1024):
+        """
+        Send a single message read from source, an async iterator
+        of bytes-like chunks, a binary file object, an mmap or any
+        other buffer, as fragments of up to fragment_size bytes.
+
+        Only about one fragment is held in memory at a time, we
+        drain between fragments and control frames can be written
+        in between. Messages passed to send() meanwhile are sent
+        once the stream is complete. Streamed messages aren't
+        compressed.
+        """
+        if self.stream_lock is None:
+            self.stream_lock = asyncio.Lock()
+
+        async with self.stream_lock:
+            self.flags |= Flags.SENDING_STREAM
+
+            try:
+                if self.deflate is not None:
+                    await self.deflate.wait_flushed()
+
+                fragment = None
+
+                async for next_fragment in read_fragments(
+                        source, fragment_size):
+                    if fragment is not None:
+                        self.send_frame(fragment, opcode, fin=0)
+                        opcode = OPCODES['stream']
+
+                        await self.drain()
+                        await asyncio.sleep(0)
+
+                    fragment = next_fragment
+
+                self.send_frame(
+                    fragment if fragment is not None else b'', opcode)
+
+            except Exception:
+                # The peer has an unfinished message, we can't go on
+                if opcode == OPCODES['stream']:
+                    self.close_websocket(
+                        STATUS_CODES['unexpected-exception'])
+
+                raise
+
+            finally:
+                self.flags &= ~Flags.SENDING_STREAM
+                self.send_deferred()
+
+    def send_deferred(self):
         """
-        if not isinstance(data, bytearray):
-            if not isinstance(data, bytes):
-                raise TypeError(
-                    'Invalid data type, expecting bytes or bytearray')
+        Send the messages and frames held back by send_stream
+        """
+        deferred = self.deferred_messages
+
+        while deferred and not self.flags & Flags.SENDING_STREAM:
+            data, opcode = deferred.popleft()
+
+            # Frames passed to write() are already encoded
+            if opcode is None:
+                self.write(data)
 
-            data = bytearray(data)
+            else:
+                self.send(data, opcode)
+
+        if not deferred:
+            self.deferred_messages = None
+
+    def send_frame(self, data, opcode, rsv=0, fin=1):
+        """
+        Encode and write a single frame
+        """
+        if self.metrics is not None:
+            self.metrics.frame_sent(self, opcode, len(data))
 
-        to_send = EncodeFrame(
-            data, 1, opcode, mask=self.flags & Flags.MASK_DATA)
+        batch = self.write_batch
 
-        self.context.write(to_send)
+        if batch is None:
+            if self.cork_writes and opcode < OPCODES['close']:
+                batch = self.cork()
+
+        # Control frames skip the batch, a close has to follow it
+        elif opcode >= OPCODES['close']:
+            if opcode == OPCODES['close']:
+                self.flush_writes()
+
+            batch = None
+
+        profiler = self.profiler
+
+        if (profiler is not None and profiler.enabled and
+                profiler.sample_send()):
+            profiler.send_frame(self, data, opcode, rsv, fin, batch)
+
+        elif (self.flags & Flags.MASK_DATA or
+                len(data) <= self.small_frame_length):
+            frame = EncodeFrame(
+                data, fin, opcode, mask=self.flags & Flags.MASK_DATA, rsv=rsv)
+
+            if batch is None:
+                self.context.write(frame)
+
+            else:
+                batch.append(frame)
+
+        elif batch is None:
+            self.context.writelines(
+                (EncodeHeader(data, fin, opcode, rsv), data))
+
+        else:
+            batch.append(EncodeHeader(data, fin, opcode, rsv))
+            batch.append(data)
 
     def close_websocket(self, status=1000, reason=''):
         frame = bytearray(struct.pack('!H', status))
@@ -234,12 +1223,24 @@ class Protocol(asyncio.Protocol):
         else:
             frame.extend(reason)
 
-        self.context.write(EncodeFrame(frame, 1, OPCODES['close']))
+        if self.metrics is not None:
+            self.metrics.closed(status)
+
+        self.send_frame(frame, OPCODES['close'])
         self.context.close()
+        self.clear_buffers()
+
+    def clear_buffers(self):
         self.recv_buffer.clear()
+        self.frame_decoder.reset()
+        self.end_fragments()
+
+
+Protocol.resolve_handlers()
 
 
 class WebSocketProtocol(Protocol):
+    __slots__ = ()
 
     def websocket_open(self):
         raise NotImplementedError('websocket_open not implemeneted')
@@ -248,27 +1249,50 @@ class WebSocketProtocol(Protocol):
         """
         Server acts as an echo server by default
         """
-        self.context.write(EncodeFrame(message, 1, type))
+        # Text arrives as a str with decode_text set
+        if isinstance(message, str):
+            message = message.encode('utf-8')
+
+        self.write(EncodeFrame(message, 1, type))
 
     def shake_hands(self):
         """
         Perform our WebSocket handshake and disconnect anything
         that doesn't look like one :')
         """
-        header_end = self.recv_buffer.find(b'\r\n\r\n') + 4
+        try:
+            header_end = self.find_header_end()
 
-        if header_end > -1:
+        except BufferExceeded:
+            self.context.write(
+                b'HTTP/1.1 431 Request Header Fields Too Large\r\n\r\n')
+            self.context.close()
+            self.recv_buffer.clear()
+
+            if self.metrics is not None:
+                self.metrics.handshake(False)
+
+            return
+
+        if header_end:
             try:
                 header = self.recv_buffer[:header_end]
                 del self.recv_buffer[:header_end]
 
-                self.header = Handshake(header)
+                self.header = Handshake(header, self.deflate_options)
+                self.deflate = self.header.deflate
                 self.context.write(self.header.response_header)
                 self.flags |= Flags.HANDSHAKE_COMPLETE
 
+                if self.metrics is not None:
+                    self.metrics.handshake(True)
+
                 self.websocket_open()
 
             except ValueError:
                 self.context.write(b'HTTP/1.1 500 Bad Request\r\n\r\n')
                 self.context.close()
                 self.recv_buffer.clear()
+
+                if self.metrics is not None:
+                    self.metrics.handshake(False)
@@ -0,0 +1,484 @@
+import asyncio
+import errno
+import json
+import os
+import selectors
+import signal
+import socket
+import time
+import weakref
+
+from .constants import Flags, STATUS_CODES
+
+
+class Worker:
+    """
+    A single forked server process, serving on its own event
+    loop and reporting its stats to the supervisor over control.
+    """
+
+    def __init__(self, supervisor, index, control):
+        self.supervisor = supervisor
+        self.index = index
+        self.control = control
+        self.protocols = weakref.WeakSet()
+        self.server = None
+        self.stopping = None
+
+    def protocol_factory(self):
+        protocol = self.supervisor.protocol()
+        self.protocols.add(protocol)
+        return protocol
+
+    def run(self):
+        supervisor = self.supervisor
+
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD):
+            signal.signal(signum, signal.SIG_DFL)
+
+        if supervisor.cpu_affinity:
+            cpus = supervisor.cpu_affinity
+            os.sched_setaffinity(0, {cpus[self.index % len(cpus)]})
+
+        if supervisor.use_uvloop:
+            # Optional, workers run the default asyncio loop without it
+            try:
+                import uvloop
+
+            except ImportError:
+                pass
+
+            else:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(self.serve())
+
+        finally:
+            loop.close()
+
+    async def serve(self):
+        supervisor = self.supervisor
+        loop = asyncio.get_event_loop()
+
+        self.stopping = loop.create_future()
+        loop.add_signal_handler(signal.SIGTERM, self.stop)
+        loop.add_signal_handler(signal.SIGINT, self.stop)
+
+        self.server = await loop.create_server(
+            self.protocol_factory,
+            sock=supervisor.worker_socket(),
+            ssl=supervisor.ssl,
+            backlog=supervisor.backlog)
+
+        reporter = asyncio.ensure_future(self.report())
+
+        await self.stopping
+
+        reporter.cancel()
+        await self.shutdown()
+
+    def stop(self):
+        if not self.stopping.done():
+            self.stopping.set_result(None)
+
+    async def shutdown(self):
+        """
+        Stop accepting, tell open websockets we're going away and
+        give them shutdown_timeout seconds to finish closing.
+        """
+        self.server.close()
+
+        for protocol in list(self.protocols):
+            context = getattr(protocol, 'context', None)
+
+            if context is None or context.is_closing():
+                continue
+
+            if protocol.flags & Flags.HANDSHAKE_COMPLETE:
+                protocol.close_websocket(
+                    STATUS_CODES['going-away'], 'Server Shutdown')
+
+            else:
+                context.close()
+
+        try:
+            await asyncio.wait_for(
+                self.server.wait_closed(), self.supervisor.shutdown_timeout)
+
+        except asyncio.TimeoutError:
+            pass
+
+    def stats(self):
+        connections = 0
+
+        for protocol in self.protocols:
+            context = getattr(protocol, 'context', None)
+
+            if context is not None and not context.is_closing():
+                connections += 1
+
+        stats = {
+            'pid': os.getpid(),
+            'worker': self.index,
+            'connections': connections,
+        }
+
+        if self.supervisor.stats is not None:
+            stats.update(self.supervisor.stats())
+
+        return stats
+
+    async def report(self):
+        """
+        Send our stats to the supervisor every stats_interval
+        seconds, one json document per line.
+        """
+        loop = asyncio.get_event_loop()
+        control = self.control
+        control.setblocking(False)
+
+        while True:
+            line = json.dumps(self.stats()).encode('utf-8') + b'\n'
+
+            try:
+                await loop.sock_sendall(control, line)
+
+            except OSError:
+                return
+
+            await asyncio.sleep(self.supervisor.stats_interval)
+
+
+class Supervisor:
+    """
+    Serve protocol on host:port from several forked worker
+    processes, each running its own event loop. Workers listen
+    with SO_REUSEPORT so the kernel balances connections between
+    them, or share one listening socket where it's unavailable.
+
+    Workers which exit unexpectedly are restarted after
+    restart_delay seconds. SIGINT or SIGTERM stops every worker,
+    waiting up to shutdown_timeout seconds before killing them.
+
+    cpu_affinity pins each worker to one CPU, pass True for every
+    CPU or a list of CPUs to pick from. Workers use uvloop when
+    use_uvloop is set and it's installed.
+
+    Workers report their stats every stats_interval seconds, the
+    number of open connections plus whatever the stats callable
+    returns. Connecting to the unix socket at control_path returns
+    them as json, summed over all workers.
+    """
+
+    def __init__(self, protocol, host='0.0.0.0', port=8080, workers=None,
+                 ssl=None, backlog=100, cpu_affinity=False, use_uvloop=True,
+                 restart_delay=1.0, shutdown_timeout=10.0,
+                 stats=None, stats_interval=1.0, control_path=None):
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+
+        if cpu_affinity is True:
+            cpu_affinity = sorted(os.sched_getaffinity(0))
+
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.ssl = ssl
+        self.backlog = backlog
+        self.cpu_affinity = list(cpu_affinity or ())
+        self.use_uvloop = use_uvloop
+        self.restart_delay = restart_delay
+        self.shutdown_timeout = shutdown_timeout
+        self.stats = stats
+        self.stats_interval = stats_interval
+        self.control_path = control_path
+
+        self.reuse_port = hasattr(socket, 'SO_REUSEPORT')
+        self.listener = None
+        self.control_server = None
+        self.selector = None
+        self.stop_requested = False
+        self.stopping = False
+
+        # pid -> (index, control socket)
+        self.children = {}
+        self.worker_stats = {}
+        self.partial = {}
+        self.restarts = []
+
+    def bind(self):
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        if self.reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+        sock.bind((self.host, self.port))
+        return sock
+
+    def worker_socket(self):
+        """
+        The listening socket for a worker, a fresh SO_REUSEPORT
+        socket or the one shared by every worker.
+        """
+        if self.reuse_port:
+            self.listener.close()
+            return self.bind()
+
+        return self.listener
+
+    def run(self):
+        """
+        Start the workers and supervise them until stopped
+        """
+        # Bound before forking so the port is known to be free and
+        # resolved (port 0) for every worker
+        self.listener = self.bind()
+        self.port = self.listener.getsockname()[1]
+
+        if not self.reuse_port:
+            self.listener.listen(self.backlog)
+
+        self.selector = selectors.DefaultSelector()
+
+        if self.control_path is not None:
+            self.open_control()
+
+        previous = {
+            signum: signal.signal(signum, self.handle_signal)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+
+        try:
+            for index in range(self.workers):
+                self.spawn(index)
+
+            while self.children:
+                self.poll()
+
+                if self.stop_requested:
+                    self.stop()
+
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+            self.close()
+
+    def spawn(self, index):
+        parent, child = socket.socketpair()
+        pid = os.fork()
+
+        if pid == 0:
+            parent.close()
+            code = 0
+
+            try:
+                self.selector.close()
+
+                if self.control_server is not None:
+                    self.control_server.close()
+
+                for other in self.children.values():
+                    other[1].close()
+
+                Worker(self, index, child).run()
+
+            except BaseException:
+                code = 1
+
+                import traceback
+                traceback.print_exc()
+
+            finally:
+                os._exit(code)
+
+        child.close()
+        parent.setblocking(False)
+        self.children[pid] = (index, parent)
+        self.selector.register(parent, selectors.EVENT_READ, pid)
+
+    def poll(self):
+        timeout = 0.5
+
+        if self.restarts:
+            until = self.restarts[0][0] - time.monotonic()
+            timeout = max(0, min(timeout, until))
+
+        for key, events in self.selector.select(timeout):
+            if key.data is None:
+                self.accept_control()
+
+            else:
+                self.read_stats(key.fileobj, key.data)
+
+        self.reap()
+
+        while self.restarts and self.restarts[0][0] <= time.monotonic():
+            when, index = self.restarts.pop(0)
+
+            if not self.stopping:
+                self.spawn(index)
+
+    def reap(self):
+        """
+        Collect exited workers, scheduling a restart for
+        the ones that weren't asked to stop.
+        """
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+
+            except ChildProcessError:
+                return
+
+            if pid == 0:
+                return
+
+            index, control = self.children.pop(pid)
+            self.forget(control)
+            control.close()
+            self.worker_stats.pop(index, None)
+            self.partial.pop(pid, None)
+
+            if not self.stopping:
+                self.restarts.append(
+                    (time.monotonic() + self.restart_delay, index))
+
+    def read_stats(self, control, pid):
+        try:
+            data = control.recv(65536)
+
+        except OSError as exc:
+            if exc.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return
+
+            data = b''
+
+        if not data:
+            self.forget(control)
+            return
+
+        data = self.partial.get(pid, b'') + data
+        *lines, self.partial[pid] = data.split(b'\n')
+        index = self.children[pid][0]
+
+        for line in lines:
+            self.worker_stats[index] = json.loads(line.decode('utf-8'))
+
+    def forget(self, control):
+        try:
+            self.selector.unregister(control)
+
+        except KeyError:
+            pass
+
+    def aggregate(self):
+        """
+        Stats summed over every worker, along with each
+        worker's own stats.
+        """
+        total = {}
+
+        for stats in self.worker_stats.values():
+            for key, value in stats.items():
+                if key in ('pid', 'worker') or isinstance(value, bool):
+                    continue
+
+                if isinstance(value, (int, float)):
+                    total[key] = total.get(key, 0) + value
+
+        total['workers'] = [
+            self.worker_stats[index] for index in sorted(self.worker_stats)
+        ]
+
+        return total
+
+    def open_control(self):
+        if os.path.exists(self.control_path):
+            os.unlink(self.control_path)
+
+        self.control_server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.control_server.bind(self.control_path)
+        self.control_server.listen(8)
+        self.control_server.setblocking(False)
+        self.selector.register(self.control_server, selectors.EVENT_READ, None)
+
+    def accept_control(self):
+        try:
+            conn, address = self.control_server.accept()
+
+        except BlockingIOError:
+            return
+
+        with conn:
+            conn.settimeout(1.0)
+
+            try:
+                conn.sendall(json.dumps(self.aggregate()).encode('utf-8'))
+
+            except OSError:
+                pass
+
+    def handle_signal(self, signum, frame):
+        self.stop_requested = True
+
+    def stop(self):
+        """
+        Stop every worker, killing any still running
+        after shutdown_timeout seconds.
+        """
+        if self.stopping:
+            return
+
+        self.stopping = True
+        self.restarts.clear()
+        self.signal_children(signal.SIGTERM)
+
+        deadline = time.monotonic() + self.shutdown_timeout
+
+        while self.children and time.monotonic() < deadline:
+            self.reap()
+            time.sleep(0.05)
+
+        self.signal_children(signal.SIGKILL)
+
+        while self.children:
+            self.reap()
+            time.sleep(0.01)
+
+    def signal_children(self, signum):
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signum)
+
+            except ProcessLookupError:
+                pass
+
+    def close(self):
+        if self.listener is not None:
+            self.listener.close()
+
+        if self.control_server is not None:
+            self.control_server.close()
+            os.unlink(self.control_path)
+
+        if self.selector is not None:
+            self.selector.close()
+
+
+def serve(protocol, host='0.0.0.0', port=8080, workers=None, **kwargs):
+    """
+    Serve protocol from workers processes, see Supervisor
+    for the other options. Blocks until SIGINT or SIGTERM.
+    """
+    Supervisor(protocol, host, port, workers, **kwargs).run()
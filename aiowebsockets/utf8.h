@@ -0,0 +1,167 @@
+#ifndef AIOWEBSOCKETS_UTF8_H
+#define AIOWEBSOCKETS_UTF8_H
+
+#include <stdint.h>
+#include <string.h>
+
+#define UTF8_ACCEPT 0
+#define UTF8_REJECT 12
+
+/*
+ * Byte classes, then the transitions between states (multiples of 12)
+ * by class, of Bjoern Hoehrmann's utf-8 DFA. See
+ * http://bjoern.hoehrmann.de/utf-8/decoder/dfa/
+ */
+static const uint8_t utf8_dfa[] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    8, 8, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    10, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 3, 3,
+    11, 6, 6, 6, 5, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+
+     0, 12, 24, 36, 60, 96, 84, 12, 12, 12, 48, 72,
+    12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+    12,  0, 12, 12, 12, 12, 12,  0, 12,  0, 12, 12,
+    12, 24, 12, 12, 12, 12, 12, 24, 12, 24, 12, 12,
+    12, 12, 12, 12, 12, 12, 12, 24, 12, 12, 12, 12,
+    12, 24, 12, 12, 12, 12, 12, 12, 12, 24, 12, 12,
+    12, 12, 12, 12, 12, 12, 12, 36, 12, 36, 12, 12,
+    12, 36, 12, 12, 12, 12, 12, 36, 12, 36, 12, 12,
+    12, 36, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+};
+
+/*
+ * Length of the longest run of whole, valid characters at the start
+ * of data, checking a character at a time and runs of ASCII up to 32
+ * bytes at a time. It stops at the first invalid or truncated character.
+ */
+static inline Py_ssize_t
+utf8_valid_prefix(const unsigned char *data, Py_ssize_t length)
+{
+    uint64_t words[4];
+    unsigned char c, next;
+    Py_ssize_t i = 0;
+
+    while (i < length) {
+        c = data[i];
+
+        if (c < 0x80) {
+            for (i++; i + 32 <= length; i += 32) {
+                memcpy(words, data + i, 32);
+
+                if ((words[0] | words[1] | words[2] | words[3]) &
+                        0x8080808080808080ULL) {
+                    break;
+                }
+            }
+
+            for (; i + 8 <= length; i += 8) {
+                memcpy(words, data + i, 8);
+
+                if (words[0] & 0x8080808080808080ULL) {
+                    break;
+                }
+            }
+
+            while (i < length && data[i] < 0x80) {
+                i++;
+            }
+
+            continue;
+        }
+
+        if (c < 0xc2 || c > 0xf4) {
+            break;
+        }
+
+        if (c < 0xe0) {
+            if (i + 1 >= length || (data[i + 1] & 0xc0) != 0x80) {
+                break;
+            }
+
+            i += 2;
+        }
+        else if (c < 0xf0) {
+            if (i + 2 >= length) {
+                break;
+            }
+
+            next = data[i + 1];
+
+            // No overlong encodings or surrogates
+            if ((next & 0xc0) != 0x80 ||
+                    (c == 0xe0 && next < 0xa0) ||
+                    (c == 0xed && next > 0x9f) ||
+                    (data[i + 2] & 0xc0) != 0x80) {
+                break;
+            }
+
+            i += 3;
+        }
+        else {
+            if (i + 3 >= length) {
+                break;
+            }
+
+            next = data[i + 1];
+
+            // No overlong encodings or code points past U+10FFFF
+            if ((next & 0xc0) != 0x80 ||
+                    (c == 0xf0 && next < 0x90) ||
+                    (c == 0xf4 && next > 0x8f) ||
+                    (data[i + 2] & 0xc0) != 0x80 ||
+                    (data[i + 3] & 0xc0) != 0x80) {
+                break;
+            }
+
+            i += 4;
+        }
+    }
+
+    return i;
+}
+
+/*
+ * Validate length bytes of data from state, returning the state after
+ * them: UTF8_ACCEPT at a character boundary, UTF8_REJECT as soon as
+ * the data is invalid, or another state in the middle of a character,
+ * to be continued with the next piece. Whole characters are checked
+ * by utf8_valid_prefix, the DFA only steps over characters split
+ * between pieces and finds out whether the rest is invalid.
+ */
+static inline uint32_t
+utf8_validate(uint32_t state, const unsigned char *data, Py_ssize_t length)
+{
+    Py_ssize_t i = 0;
+
+    while (i < length) {
+        if (state == UTF8_ACCEPT) {
+            i += utf8_valid_prefix(data + i, length - i);
+
+            if (i == length) {
+                break;
+            }
+        }
+
+        state = utf8_dfa[256 + state + utf8_dfa[data[i++]]];
+
+        if (state == UTF8_REJECT) {
+            break;
+        }
+    }
+
+    return state;
+}
+
+#endif
@@ -1,5 +1,90 @@
-import itertools
+import asyncio
 
 
-def fast_mask(data, mask):
-    return bytes(b ^ m for b, m in zip(data, itertools.cycle(mask)))
+def rotate_mask(mask, offset):
+    """
+    Rotate the 4 byte mask so that it starts at offset
+    """
+    offset &= 3
+    return bytes(mask[offset:]) + bytes(mask[:offset])
+
+
+def fast_mask(data, mask, offset=0):
+    """
+    Pure python fallback for fast_mask.c, XoRs the whole
+    payload as a single integer instead of byte by byte.
+    """
+    if len(mask) != 4:
+        raise ValueError('mask must be 4 bytes long')
+
+    length = len(data)
+    mask = rotate_mask(mask, offset)
+
+    if not length:
+        return bytearray()
+
+    key = (mask * (length // 4 + 1))[:length]
+    masked = int.from_bytes(data, 'little') ^ int.from_bytes(key, 'little')
+
+    return bytearray(masked.to_bytes(length, 'little'))
+
+
+def fast_mask_inplace(data, mask, offset=0):
+    """
+    Pure python fallback for fast_mask.c's fast_mask_inplace
+    """
+    data[:] = fast_mask(data, mask, offset)
+
+    return (offset + len(data)) & 3
+
+
+def frame_header_length(frame):
+    """
+    Length of an encoded frame's header, including the mask key
+    """
+    length = frame[1] & 0x7f
+    header_length = 2
+
+    if length == 126:
+        header_length = 4
+
+    elif length == 127:
+        header_length = 10
+
+    if frame[1] & 0x80:
+        header_length += 4
+
+    return header_length
+
+
+async def read_fragments(source, fragment_size):
+    """
+    Yield the contents of an async iterator, a file object
+    (or mmap) or a buffer in pieces of up to fragment_size bytes.
+    File objects are read in the loop's default executor, so
+    slow disks don't hold up the loop.
+    """
+    if hasattr(source, '__aiter__'):
+        async for chunk in source:
+            view = memoryview(chunk).cast('B')
+
+            for start in range(0, len(view), fragment_size):
+                yield view[start:start + fragment_size]
+
+    elif hasattr(source, 'read'):
+        loop = asyncio.get_event_loop()
+
+        while True:
+            chunk = await loop.run_in_executor(
+                None, source.read, fragment_size)
+
+            if not chunk:
+                break
+
+            yield chunk
+
+    else:
+        view = memoryview(source).cast('B')
+
+        for start in range(0, len(view), fragment_size):
+            yield view[start:start + fragment_size]
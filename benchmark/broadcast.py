@@ -0,0 +1,64 @@
+import time
+
+import aiowebsockets
+from aiowebsockets.constants import Flags
+
+
+SUBSCRIBERS = (1000, 10000, 100000)
+MESSAGE = b'{"The":"Quick","Brown":"Fox","Jumped":"Over","The":"Lazy","Dog":"."}'
+
+
+class NullTransport:
+    """
+    Accepts writes without touching a socket, so that only
+    the cost of the fan-out itself is measured.
+    """
+    def write(self, data):
+        pass
+
+    def writelines(self, data):
+        pass
+
+    def is_closing(self):
+        return False
+
+    def get_write_buffer_size(self):
+        return 0
+
+
+class Subscriber(aiowebsockets.WebSocketProtocol):
+
+    def __init__(self):
+        self.context = NullTransport()
+        self.create_buffers()
+        self.flags |= Flags.HANDSHAKE_COMPLETE
+
+
+def fan_out(broadcast):
+    start = time.perf_counter()
+    broadcast()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    print('{:>10} {:>12} {:>12} {:>14}'.format(
+        'subscribers', 'hub ms', 'send() ms', 'hub ns/conn'))
+
+    for count in SUBSCRIBERS:
+        hub = aiowebsockets.Hub()
+        subscribers = [Subscriber() for i in range(count)]
+
+        for subscriber in subscribers:
+            hub.join('feed', subscriber)
+
+        def each_send():
+            for subscriber in subscribers:
+                subscriber.send(MESSAGE)
+
+        hub_time = min(
+            fan_out(lambda: hub.broadcast('feed', MESSAGE))
+            for i in range(5))
+        send_time = min(fan_out(each_send) for i in range(5))
+
+        print('{:>10} {:>12.2f} {:>12.2f} {:>14.1f}'.format(
+            count, hub_time * 1e3, send_time * 1e3, hub_time * 1e9 / count))
@@ -4,17 +4,43 @@ import uvloop
 import aiowebsockets
 
 
+CONNECTIONS = 1024
+MESSAGE = b'{"The":"Quick","Brown":"Fox","Jumped":"Over","The":"Lazy","Dog":"."}'
+
+received = 0
+
+
 async def connect_client():
+    global received
+
     async with aiowebsockets.Connect('ws://localhost:2053') as context:
-        context.send(b'{"The":"Quick","Brown":"Fox","Jumped":"Over","The":"Lazy","Dog":"."}')
+        context.send(MESSAGE)
+
+        while True:
+            messages = await context.recv_many()
+
+            if not messages:
+                break
+
+            received += len(messages)
+
+            for message in messages:
+                context.send(message)
+
+
+async def report():
+    global received
 
-        async for message in context:
-            context.send(message)
+    while True:
+        await asyncio.sleep(1)
+        print('{} messages/s received'.format(received))
+        received = 0
 
 
 if __name__ == '__main__':
     asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-    tasks = [connect_client() for i in range(1024)]
+    loop = asyncio.get_event_loop()
+    reporter = loop.create_task(report())
+    tasks = [connect_client() for i in range(CONNECTIONS)]
 
-    asyncio.get_event_loop().run_until_complete(
-        asyncio.wait(tasks))
+    loop.run_until_complete(asyncio.wait(tasks))
@@ -0,0 +1,58 @@
+import time
+
+from aiowebsockets.framing import FrameDecoder, EncodeFrame
+
+
+FRAME_SIZE = 64
+TOTAL_FRAMES = 1 << 18
+FRAMES_PER_READ = (1, 4, 16, 64, 256, 1024, 4096)
+
+
+def per_read(frame, frames_per_read, compact_per_frame):
+    """
+    Feed TOTAL_FRAMES frames into a decoder, frames_per_read
+    at a time, the same way Protocol.data_received does.
+    Returns the cost of a single frame in nanoseconds.
+    """
+    chunk = bytes(frame * frames_per_read)
+    reads = TOTAL_FRAMES // frames_per_read
+    buffer = bytearray()
+    decoder = FrameDecoder(buffer)
+
+    start = time.perf_counter()
+
+    for i in range(reads):
+        buffer.extend(chunk)
+
+        if compact_per_frame:
+            for frame in decoder:
+                del buffer[:len(frame)]
+                decoder.reset()
+
+        else:
+            for frame in decoder:
+                pass
+
+            decoder.compact()
+
+    elapsed = time.perf_counter() - start
+
+    return elapsed * 1e9 / (reads * frames_per_read)
+
+
+if __name__ == '__main__':
+    for masked in (False, True):
+        frame = EncodeFrame(bytearray(FRAME_SIZE), 1, 2, mask=masked)
+
+        print('{} byte frames, masked={}'.format(FRAME_SIZE, masked))
+        print('{:>8} {:>14} {:>14}'.format(
+            'per read', 'ns/frame', 'ns/frame (del)'))
+
+        for frames_per_read in FRAMES_PER_READ:
+            print('{:>8} {:>14.1f} {:>14.1f}'.format(
+                frames_per_read,
+                per_read(frame, frames_per_read, False),
+                per_read(frame, frames_per_read, True)
+            ))
+
+        print()
@@ -0,0 +1,87 @@
+import time
+
+import aiowebsockets
+from aiowebsockets.constants import Flags
+from aiowebsockets.keepalive import TimerWheel
+
+
+CONNECTIONS = (1000, 10000, 100000)
+PING_INTERVAL = 30
+TICKS = 120
+
+
+class ManualLoop:
+    """
+    Just enough of an event loop for a TimerWheel, time
+    only moves when we tick the wheel.
+    """
+    clock = 0.0
+
+    def time(self):
+        return self.clock
+
+    def call_later(self, delay, callback):
+        return self
+
+
+class NullTransport:
+
+    def write(self, data):
+        pass
+
+    def is_closing(self):
+        return False
+
+
+class Connection(aiowebsockets.WebSocketProtocol):
+    ping_interval = PING_INTERVAL
+
+    def __init__(self, wheel):
+        self.context = NullTransport()
+        self.create_buffers()
+        self.flags |= Flags.HANDSHAKE_COMPLETE
+        self.keepalive_wheel = wheel
+
+    def ping(self, data=b''):
+        # Answer straight away, as a healthy peer would
+        self.last_read = self.keepalive.now
+
+
+def run(count):
+    """
+    Tick a wheel holding count connections TICKS times, returns
+    the average tick in microseconds and the connections checked.
+    """
+    loop = ManualLoop()
+    wheel = TimerWheel(loop)
+    connections = [Connection(wheel) for i in range(count)]
+
+    # Spread the connections over the ping interval
+    for i, connection in enumerate(connections):
+        connection.keepalive = wheel
+        connection.last_read = wheel.now - i % PING_INTERVAL
+        wheel.add(connection, connection.last_read + PING_INTERVAL)
+
+    checked = 0
+    elapsed = 0
+
+    for i in range(TICKS):
+        checked += len(wheel.buckets[(wheel.cursor + 1) % len(wheel.buckets)])
+        loop.clock += wheel.resolution
+        start = time.perf_counter()
+        wheel.tick()
+        elapsed += time.perf_counter() - start
+
+
+    return elapsed * 1e6 / TICKS, checked
+
+
+if __name__ == '__main__':
+    print('{:>11} {:>10} {:>14} {:>12}'.format(
+        'connections', 'us/tick', 'checked/tick', 'ns/checked'))
+
+    for count in CONNECTIONS:
+        tick, checked = run(count)
+
+        print('{:>11} {:>10.1f} {:>14} {:>12.1f}'.format(
+            count, tick, checked // TICKS, tick * 1e3 * TICKS / checked))
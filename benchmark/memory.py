@@ -0,0 +1,135 @@
+import asyncio
+import gc
+import tracemalloc
+
+import aiowebsockets
+from aiowebsockets.framing import EncodeFrame
+
+
+CONNECTIONS = 10000
+HANDSHAKE = (
+    b'GET / HTTP/1.1\r\n'
+    b'Host: localhost\r\n'
+    b'Upgrade: websocket\r\n'
+    b'Connection: Upgrade\r\n'
+    b'Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n'
+    b'Sec-WebSocket-Version: 13\r\n\r\n'
+)
+MESSAGE = bytes(EncodeFrame(b'x' * 512, 1, 2, mask=True))
+
+
+class NullSocket:
+
+    def setsockopt(self, *args):
+        pass
+
+
+class NullTransport:
+    """
+    Just enough of a transport to accept a connection, so
+    that only the protocol's own state is measured.
+    """
+    socket = NullSocket()
+
+    def get_extra_info(self, name, default=None):
+        return self.socket
+
+    def set_write_buffer_limits(self, high=None, low=None):
+        pass
+
+    def write(self, data):
+        pass
+
+    def writelines(self, data):
+        pass
+
+    def is_closing(self):
+        return False
+
+
+TRANSPORT = NullTransport()
+
+
+class Handlers:
+    __slots__ = ()
+
+    def websocket_open(self):
+        pass
+
+    def on_message(self, message, type):
+        pass
+
+
+class Echo(Handlers, aiowebsockets.WebSocketProtocol):
+    pass
+
+
+class SlotEcho(Handlers, aiowebsockets.WebSocketProtocol):
+    __slots__ = ()
+
+
+class BufferedEcho(Handlers, aiowebsockets.BufferedWebSocketProtocol):
+    pass
+
+
+class BufferedSlotEcho(Handlers, aiowebsockets.BufferedWebSocketProtocol):
+    __slots__ = ()
+
+
+class SharedSlotEcho(BufferedSlotEcho):
+    __slots__ = ()
+    share_read_buffer = True
+
+
+def receive(protocol, data):
+    if isinstance(protocol, asyncio.BufferedProtocol):
+        buffer = protocol.get_buffer(len(data))
+        buffer[:len(data)] = data
+        protocol.buffer_updated(len(data))
+
+    else:
+        protocol.data_received(data)
+
+
+def connect(protocol_class):
+    """
+    An idle connection, which has completed the
+    handshake and received a single message.
+    """
+    protocol = protocol_class()
+    protocol.connection_made(TRANSPORT)
+    receive(protocol, HANDSHAKE)
+    receive(protocol, MESSAGE)
+    return protocol
+
+
+def bytes_per_connection(protocol_class):
+    gc.collect()
+    tracemalloc.start()
+
+    start = tracemalloc.get_traced_memory()[0]
+    connections = [connect(protocol_class) for i in range(CONNECTIONS)]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - start
+
+    tracemalloc.stop()
+    del connections
+
+    return size / CONNECTIONS
+
+
+async def main():
+    print('{:>36} {:>12}'.format('protocol', 'bytes/conn'))
+
+    for protocol_class, name in (
+            (Echo, 'WebSocketProtocol'),
+            (SlotEcho, 'WebSocketProtocol, __slots__'),
+            (BufferedEcho, 'BufferedWebSocketProtocol'),
+            (BufferedSlotEcho, 'BufferedWebSocketProtocol, __slots__'),
+            (SharedSlotEcho, '+ share_read_buffer')):
+        print('{:>36} {:>12.0f}'.format(
+            name, bytes_per_connection(protocol_class)))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
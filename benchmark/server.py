@@ -1,4 +1,5 @@
 import asyncio
+import sys
 import uvloop
 import time
 
@@ -6,47 +7,46 @@ import aiowebsockets
 
 
 class Client(aiowebsockets.WebSocketProtocol):
-    request_count = 0
-    bytes_per_sec = 0
-    client_count = 0
+    metrics = aiowebsockets.Metrics()
 
     def websocket_open(self):
-        Client.client_count += 1
-
-    def connection_lost(self, exc):
-        Client.client_count -= 1
+        pass
 
     def on_message(self, message, type):
         self.send(message, type)
-        Client.bytes_per_sec += len(message)
-        Client.request_count += 1
 
     """
     async - Incurs slight performance hit due to ensure_future
 
     async def on_message(self, message, type):
         self.send(message, type)
-        Client.bytes_per_sec += len(message)
-        Client.request_count += 1
     """
 
 
+class BufferedClient(aiowebsockets.BufferedWebSocketProtocol, Client):
+    pass
+
+
 async def counter():
+    metrics = Client.metrics
     last_iteration = time.time() * 1000
+    last_messages = last_bytes = 0
 
     while True:
+        messages = sum(metrics.messages.values())
+        received = sum(metrics.bytes_in.values())
+
         print(
             '{} KB/s; {} RPS; {} Connections; {}'.format(
-                int(Client.bytes_per_sec / 1024),
-                Client.request_count,
-                Client.client_count,
+                int((received - last_bytes) / 1024),
+                messages - last_messages,
+                metrics.connections,
                 time.time() * 1000 - last_iteration
             )
         )
 
         last_iteration = time.time() * 1000
-        Client.request_count = 0
-        Client.bytes_per_sec = 0
+        last_messages, last_bytes = messages, received
         await asyncio.sleep(1)
 
 
@@ -54,7 +54,8 @@ if __name__ == '__main__':
     asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     loop = asyncio.get_event_loop()
 
-    server = loop.create_server(Client, '0.0.0.0', 2053)
+    protocol = BufferedClient if '--buffered' in sys.argv else Client
+    server = loop.create_server(protocol, '0.0.0.0', 2053)
 
     loop.run_until_complete(server)
     asyncio.ensure_future(counter())
@@ -0,0 +1,535 @@
+"""
+Offline benchmark suite, everything runs on loopback.
+
+    python benchmark/suite.py run [--quick] [--only PATTERN] [--output FILE]
+    python benchmark/suite.py run --save-baseline [NAME]
+    python benchmark/suite.py compare [BASELINE] RESULTS [--threshold 0.1]
+
+Results are json, {"meta": {...}, "results": {name: {"value", "unit",
+"better"}}}. Baselines are stored in benchmark/baselines/NAME.json,
+compare exits with 1 when any result regressed by more than threshold.
+"""
+import argparse
+import asyncio
+import fnmatch
+import json
+import multiprocessing
+import os
+import platform
+import socket
+import struct
+import sys
+import time
+
+import uvloop
+
+import aiowebsockets
+from aiowebsockets import utils
+from aiowebsockets.fast_mask import fast_mask
+from aiowebsockets.framing import FrameDecoder, EncodeFrame, EncodeHeader
+from aiowebsockets.handshake import Handshake
+from aiowebsockets.deflate import DeflateOptions
+
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'baselines')
+
+HANDSHAKE = (
+    b'GET /chat HTTP/1.1\r\n'
+    b'Host: localhost:2053\r\n'
+    b'Upgrade: websocket\r\n'
+    b'Connection: Upgrade\r\n'
+    b'Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n'
+    b'Origin: http://localhost\r\n'
+    b'Sec-WebSocket-Version: 13\r\n\r\n'
+)
+DEFLATE_HANDSHAKE = HANDSHAKE[:-2] + (
+    b'Sec-WebSocket-Extensions: permessage-deflate; '
+    b'client_max_window_bits\r\n\r\n')
+
+
+class Results:
+
+    def __init__(self, only=None):
+        self.only = only
+        self.results = {}
+
+    def wanted(self, name):
+        return self.only is None or fnmatch.fnmatch(name, self.only)
+
+    def add(self, name, value, unit, better='lower'):
+        self.results[name] = {
+            'value': value, 'unit': unit, 'better': better}
+        print('{:<48} {:>14.1f} {}'.format(name, value, unit))
+
+
+def measure(func, number, repeat=5):
+    """
+    Best of repeat runs of func() called number times,
+    in nanoseconds per call.
+    """
+    best = None
+
+    for i in range(repeat):
+        start = time.perf_counter_ns()
+
+        for j in range(number):
+            func()
+
+        elapsed = (time.perf_counter_ns() - start) / number
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+"""
+Microbenchmarks
+"""
+
+
+def bench_decoder(results, quick):
+    total = (1 << 20) if quick else (1 << 23)
+
+    for size in (16, 125, 1024, 16384, 131072):
+        for masked in (False, True):
+            frame = bytes(EncodeFrame(bytes(size), 1, 2, mask=masked))
+
+            for per_read in (1, 16, 256):
+                name = 'decoder.{}B.{}.{}_per_read'.format(
+                    size, 'masked' if masked else 'unmasked', per_read)
+
+                if not results.wanted(name):
+                    continue
+
+                chunk = frame * per_read
+                reads = max(1, total // len(chunk))
+                buffer = bytearray()
+                decoder = FrameDecoder(buffer)
+
+                def read():
+                    buffer.extend(chunk)
+                    decoder.feed(len(chunk))
+
+                    for frame in decoder:
+                        pass
+
+                    decoder.compact()
+
+                results.add(name, measure(read, reads) / per_read,
+                            'ns/frame')
+
+
+def bench_encode(results, quick):
+    number = 20000 if quick else 200000
+
+    for size in (16, 125, 1024, 16384, 131072):
+        data = bytes(size)
+        count = max(100, number * 16 // max(size, 16))
+
+        for masked in (False, True):
+            name = 'encode.frame.{}B.{}'.format(
+                size, 'masked' if masked else 'unmasked')
+
+            if results.wanted(name):
+                results.add(name, measure(
+                    lambda: EncodeFrame(data, 1, 2, mask=masked), count),
+                    'ns/frame')
+
+        name = 'encode.header.{}B'.format(size)
+
+        if results.wanted(name):
+            results.add(name, measure(
+                lambda: EncodeHeader(data, 1, 2), number), 'ns/frame')
+
+
+def bench_mask(results, quick):
+    key = b'\x12\x34\x56\x78'
+    number = 2000 if quick else 20000
+
+    for size in (16, 1024, 65536, 1048576):
+        data = bytes(size)
+        count = max(10, number * 64 // size)
+
+        for name, func in (('c', fast_mask), ('python', utils.fast_mask)):
+            name = 'mask.{}.{}B'.format(name, size)
+
+            if results.wanted(name):
+                elapsed = measure(lambda: func(data, key), count)
+                results.add(name, size * 1e3 / elapsed, 'MB/s', 'higher')
+
+
+def bench_handshake(results, quick):
+    number = 5000 if quick else 50000
+    options = DeflateOptions()
+
+    for name, request, deflate in (
+            ('handshake.plain', HANDSHAKE, None),
+            ('handshake.deflate', DEFLATE_HANDSHAKE, options)):
+        if results.wanted(name):
+            results.add(name, measure(
+                lambda: Handshake(request, deflate).response_header, number),
+                'ns/handshake')
+
+
+"""
+End to end, the server runs in its own process
+"""
+
+
+class EchoServer(aiowebsockets.WebSocketProtocol):
+    __slots__ = ()
+
+    def websocket_open(self):
+        pass
+
+    def on_message(self, message, type):
+        self.send(message, type)
+
+
+class BroadcastServer(aiowebsockets.WebSocketProtocol):
+    __slots__ = ()
+    hub = aiowebsockets.Hub()
+
+    def websocket_open(self):
+        self.hub.join('all', self)
+
+    def on_message(self, message, type):
+        self.hub.broadcast('all', message, type)
+
+    def connection_lost(self, exc):
+        super().connection_lost(exc)
+        self.hub.leave_all(self)
+
+
+def run_server(protocol, use_uvloop, pipe):
+    if use_uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(
+        loop.create_server(protocol, '127.0.0.1', 0))
+
+    pipe.send(server.sockets[0].getsockname()[1])
+    loop.run_forever()
+
+
+class Server:
+    """
+    Context manager running protocol in a forked process
+    """
+
+    def __init__(self, protocol, use_uvloop):
+        self.protocol = protocol
+        self.use_uvloop = use_uvloop
+
+    def __enter__(self):
+        context = multiprocessing.get_context('fork')
+        parent, child = context.Pipe()
+
+        self.process = context.Process(
+            target=run_server, args=(self.protocol, self.use_uvloop, child),
+            daemon=True)
+        self.process.start()
+        self.port = parent.recv()
+        return self
+
+    def __exit__(self, *args):
+        self.process.terminate()
+        self.process.join()
+
+
+class BenchClient(asyncio.Protocol):
+    """
+    Minimal client, so that we measure the server rather than
+    aiowebsockets.Connect's queue.
+    """
+
+    def __init__(self, on_message):
+        self.on_message = on_message
+        self.buffer = bytearray()
+        self.decoder = FrameDecoder(self.buffer)
+        self.opened = asyncio.get_event_loop().create_future()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        sock = transport.get_extra_info('socket')
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+        transport.write(HANDSHAKE)
+
+    def data_received(self, data):
+        self.buffer.extend(data)
+
+        if not self.opened.done():
+            header_end = self.buffer.find(b'\r\n\r\n')
+
+            if header_end == -1:
+                return
+
+            del self.buffer[:header_end + 4]
+            self.opened.set_result(None)
+
+        self.decoder.feed(len(self.buffer) - self.decoder.end)
+
+        for frame in self.decoder:
+            self.on_message(frame.data)
+
+        self.decoder.compact()
+
+    def send(self, data):
+        self.transport.write(EncodeFrame(data, 1, 2, mask=True))
+
+
+async def connect(port, on_message):
+    transport, client = await asyncio.get_event_loop().create_connection(
+        lambda: BenchClient(on_message), '127.0.0.1', port)
+    await client.opened
+    return client
+
+
+async def echo_scenario(port, connections, size, duration):
+    """
+    Each connection sends a message and waits for it to be
+    echoed back before sending the next one.
+    """
+    loop = asyncio.get_event_loop()
+    latencies = []
+    payload = bytes(size)
+    deadline = time.perf_counter() + duration
+
+    async def run(client, waiter):
+        while time.perf_counter() < deadline:
+            waiter[0] = loop.create_future()
+            start = time.perf_counter_ns()
+            client.send(payload)
+            await waiter[0]
+            latencies.append(time.perf_counter_ns() - start)
+
+        client.transport.close()
+
+    clients = []
+
+    for i in range(connections):
+        waiter = [None]
+        client = await connect(
+            port, lambda data, waiter=waiter: waiter[0].set_result(None))
+        clients.append(run(client, waiter))
+
+    start = time.perf_counter()
+    await asyncio.gather(*clients)
+
+    return latencies, time.perf_counter() - start
+
+
+async def broadcast_scenario(port, connections, size, duration):
+    """
+    One connection publishes a timestamped message, which the
+    server broadcasts to every connection, the next is published
+    once all of them have received it.
+    """
+    loop = asyncio.get_event_loop()
+    latencies = []
+    pending = [0, None]
+    padding = bytes(max(0, size - 8))
+
+    def on_message(data):
+        latencies.append(
+            time.perf_counter_ns() - struct.unpack_from('!Q', data)[0])
+        pending[0] -= 1
+
+        if not pending[0]:
+            pending[1].set_result(None)
+
+    clients = [await connect(port, on_message) for i in range(connections)]
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+
+    while time.perf_counter() < deadline:
+        pending[:] = connections, loop.create_future()
+        clients[0].send(struct.pack('!Q', time.perf_counter_ns()) + padding)
+        await pending[1]
+
+    elapsed = time.perf_counter() - start
+
+    for client in clients:
+        client.transport.close()
+
+    return latencies, elapsed
+
+
+def bench_end_to_end(results, quick, use_uvloop):
+    duration = 1.0 if quick else 5.0
+
+    scenarios = (
+        ('echo', EchoServer, echo_scenario, 'messages/s'),
+        ('broadcast', BroadcastServer, broadcast_scenario, 'deliveries/s'),
+    )
+
+    for name, protocol, scenario, unit in scenarios:
+        for connections in (1, 64):
+            for size in (64, 4096):
+                prefix = '{}.{}conn.{}B'.format(name, connections, size)
+
+                if not any(results.wanted(prefix + metric) for metric in (
+                        '.throughput', '.p50', '.p99', '.p999')):
+                    continue
+
+                with Server(protocol, use_uvloop) as server:
+                    latencies, elapsed = run_loop(scenario(
+                        server.port, connections, size, duration), use_uvloop)
+
+                latencies.sort()
+
+                results.add(prefix + '.throughput',
+                            len(latencies) / elapsed, unit, 'higher')
+
+                for label, fraction in (
+                        ('p50', 0.5), ('p99', 0.99), ('p999', 0.999)):
+                    results.add('{}.{}'.format(prefix, label),
+                                percentile(latencies, fraction) / 1e3, 'us')
+
+
+def run_loop(coroutine, use_uvloop):
+    if use_uvloop:
+        return uvloop.run(coroutine)
+
+    return asyncio.run(coroutine)
+
+
+"""
+Commands
+"""
+
+
+def run(args):
+    results = Results(args.only)
+
+    bench_decoder(results, args.quick)
+    bench_encode(results, args.quick)
+    bench_mask(results, args.quick)
+    bench_handshake(results, args.quick)
+
+    if not args.micro:
+        bench_end_to_end(results, args.quick, not args.asyncio)
+
+    document = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'loop': 'asyncio' if args.asyncio else 'uvloop',
+            'quick': args.quick,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results.results,
+    }
+
+    output = args.output
+
+    if args.save_baseline is not None:
+        os.makedirs(BASELINES, exist_ok=True)
+        output = os.path.join(BASELINES, args.save_baseline + '.json')
+
+    if output is not None:
+        with open(output, 'w') as file:
+            json.dump(document, file, indent=2, sort_keys=True)
+
+        print('Results written to', output)
+
+
+def load(path):
+    if not os.path.exists(path):
+        path = os.path.join(BASELINES, path + '.json')
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(args):
+    """
+    Compare results against a baseline, returns the number of
+    results which got worse by more than threshold.
+    """
+    baseline = load(args.baseline)['results']
+    current = load(args.results)['results']
+    regressions = 0
+
+    print('{:<48} {:>12} {:>12} {:>8}'.format(
+        'benchmark', 'baseline', 'current', 'change'))
+
+    for name in sorted(set(baseline) & set(current)):
+        before = baseline[name]['value']
+        after = current[name]['value']
+
+        if not before:
+            continue
+
+        change = (after - before) / before
+
+        # Positive when it got worse
+        worse = change if current[name]['better'] == 'lower' else -change
+        status = ''
+
+        if worse > args.threshold:
+            status = 'REGRESSED'
+            regressions += 1
+
+        elif worse < -args.threshold:
+            status = 'improved'
+
+        print('{:<48} {:>12.1f} {:>12.1f} {:>+7.1%} {}'.format(
+            name, before, after, change, status))
+
+    for name in sorted(set(baseline) - set(current)):
+        print('{:<48} missing from results'.format(name))
+
+    print('{} regression(s) over {:.0%}'.format(regressions, args.threshold))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='aiowebsockets benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--quick', action='store_true',
+                            help='fewer iterations and shorter scenarios')
+    run_parser.add_argument('--micro', action='store_true',
+                            help='skip the end to end scenarios')
+    run_parser.add_argument('--asyncio', action='store_true',
+                            help='use the asyncio loop instead of uvloop')
+    run_parser.add_argument('--only', metavar='PATTERN',
+                            help='only run benchmarks matching PATTERN')
+    run_parser.add_argument('--output', metavar='FILE',
+                            help='write the results to FILE')
+    run_parser.add_argument('--save-baseline', metavar='NAME', nargs='?',
+                            const=platform.node() or 'default',
+                            help='store the results as a baseline')
+
+    compare_parser = commands.add_parser(
+        'compare', help='compare results against a baseline')
+    compare_parser.add_argument(
+        'baseline', nargs='?', default=platform.node() or 'default',
+        help='baseline file or stored baseline name')
+    compare_parser.add_argument('results', help='results file')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='allowed slowdown, 0.1 is 10%%')
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        run(args)
+
+    elif compare(args):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
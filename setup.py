@@ -10,10 +10,12 @@ ext = ['c', 'pyx'][int(USE_CYTHON)]
 extensions
 """
 fast_mask = Extension(
-    'aiowebsockets.fast_mask', sources=['aiowebsockets/fast_mask.c'])
+    'aiowebsockets.fast_mask', sources=['aiowebsockets/fast_mask.c'],
+    depends=['aiowebsockets/mask.h'])
 
 ext_framing = Extension(
-    'aiowebsockets.framing', ['aiowebsockets/framing.' + ext])
+    'aiowebsockets.framing', ['aiowebsockets/framing.' + ext],
+    depends=['aiowebsockets/mask.h', 'aiowebsockets/utf8.h'])
 
 extensions = [fast_mask, ext_framing]
 